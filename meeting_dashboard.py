@@ -1,17 +1,101 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
 import time
+import math
+import traceback
+import uuid
+import io
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 import psycopg2
 from psycopg2.extras import execute_values, RealDictCursor
 from psycopg2.pool import SimpleConnectionPool
 from contextlib import contextmanager
+from functools import lru_cache
 
 # Configuration
-EXCEL_FILE = "Meeting_Schedule_Template.xlsx"
+DATA_FILE = "meetings.parquet"
+EXCEL_FILE = "Meeting_Schedule_Template.xlsx"  # Legacy storage, migrated to DATA_FILE on first load
+EXCEL_FILE_PODCAST = "Podcast_Meetings_Template.xlsx"
+INSERTS_DIR = "meetings_inserts"  # One small Parquet file per added meeting, merged into DATA_FILE on compaction
+INSERTS_COMPACT_THRESHOLD = 50
+EDIT_SELECT_LIMIT = 500  # Most recent meetings offered in the Edit page selectbox
+MEETINGS_PAGE_SIZE = 50  # Rows rendered per page of the Summary meetings table
+
+# Columns of the meeting schedule template, in display/export order
+TEMPLATE_COLUMNS = (
+    'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
+    'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
+    'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
+    'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
+    'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
+)
+# Non-text dtypes of the meetings frame, as load_data leaves them; frames built from row dicts use these instead of inference
+MEETING_DTYPES = {'Meeting ID': 'Int64', 'Meeting Date': 'datetime64[ns]', 'Follow up Date': 'datetime64[ns]'}
+
+# Columns of the podcast meeting template
+PODCAST_TEMPLATE_COLUMNS = (
+    'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
+    'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
+)
+
+# Columns matched by the Summary page search box
+SEARCH_COLUMNS = (
+    'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
+    'Purpose', 'Attendees', 'Internal External Guests', 'Notes'
+)
+SEARCH_BLOB_DTYPE = 'string[pyarrow]'
+
+# Low-cardinality columns held as categoricals; known values come first, then '' and anything else seen in the data
+MEETING_CATEGORIES = {
+    'Status': ('Upcoming', 'Ongoing', 'Ended', 'Completed'),
+    'Priority': ('Low', 'Medium', 'High', 'Urgent'),
+    'Meeting Type': ('In Person', 'Virtual'),
+    'Reminder Sent': ('Yes', 'No'),
+    'Calendar Sync': ('Yes', 'No'),
+    # Free text in the forms, but in practice a handful of zones; typed-in zones become extra categories
+    'Time Zone': ('UTC',),
+}
+# Selectbox options and their positions, for picking the current value's index
+STATUS_OPTIONS = MEETING_CATEGORIES['Status']
+PRIORITY_OPTIONS = MEETING_CATEGORIES['Priority']
+MEETING_TYPE_OPTIONS = MEETING_CATEGORIES['Meeting Type']
+YES_NO_OPTIONS = MEETING_CATEGORIES['Reminder Sent']
+STATUS_FILTER_OPTIONS = ('All',) + STATUS_OPTIONS
+PODCAST_STATUS_OPTIONS = ('Upcoming', 'Completed', 'Cancelled')
+STATUS_INDEX = {value: i for i, value in enumerate(STATUS_OPTIONS)}
+PRIORITY_INDEX = {value: i for i, value in enumerate(PRIORITY_OPTIONS)}
+# Text fields of the Edit form and the value shown when a meeting lacks the column
+EDIT_FORM_TEXT_DEFAULTS = {
+    'Organization': '',
+    'Client': '',
+    'Stakeholder Name': '',
+    'Purpose': '',
+    'Meeting Type': 'Virtual',
+    'Priority': 'Medium',
+    'Status': 'Upcoming',
+    'Time Zone': 'UTC',
+    'Meeting Link': '',
+    'Website': '',
+    'Attendees': '',
+    'Internal External Guests': '',
+    'Agenda': '',
+    'Notes': '',
+    'Next Action': '',
+    'Reminder Sent': 'No',
+    'Calendar Sync': 'No',
+    'Calendar Event Title': '',
+}
+# Fields the Add New Meeting form refuses to save blank, in the order their errors are shown
+ADD_FORM_REQUIRED_FIELDS = ('Stakeholder Name', 'Attendees', 'Internal External Guests')
 DATE_FORMAT = "%Y-%m-%d %H:%M"
+TIME_FORMATS = ('%H:%M:%S', '%H:%M', '%I:%M %p', '%I:%M:%S %p')
+MEETING_DURATION = timedelta(hours=1)  # The template has no end time
 
 # Supabase Database Configuration
 def get_db_config():
@@ -65,6 +149,29 @@ if 'podcast_data_loaded' not in st.session_state:
     st.session_state.podcast_data_loaded = False
 if 'selected_podcast_meetings' not in st.session_state:
     st.session_state.selected_podcast_meetings = set()
+# Bumped whenever meetings_df changes; keys per-session derived data
+if 'meetings_version' not in st.session_state:
+    st.session_state.meetings_version = 0
+# Rows added since meetings_df was last read; folded in by get_meetings_df()
+if 'pending_inserts' not in st.session_state:
+    st.session_state.pending_inserts = []
+# Highest Meeting ID handed out locally; None means recompute from meetings_df
+if 'max_meeting_id' not in st.session_state:
+    st.session_state.max_meeting_id = None
+
+def bump_meetings_version():
+    """Mark meetings_df as changed so derived data is rebuilt"""
+    st.session_state.meetings_version += 1
+
+def _memoize_on_version(name, key, build):
+    """Return build() cached in session state until key changes"""
+    cache = st.session_state.setdefault('_version_cache', {})
+    hit = cache.get(name)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    value = build()
+    cache[name] = (key, value)
+    return value
 
 @contextmanager
 def get_db_connection():
@@ -163,11 +270,11 @@ def load_meetings_from_supabase():
                 
                 if rows:
                     df = pd.DataFrame(rows)
-                    # Convert date columns
+                    # Convert date columns; the database only returns ISO dates, so skip format inference
                     if 'Meeting Date' in df.columns:
-                        df['Meeting Date'] = pd.to_datetime(df['Meeting Date'], errors='coerce')
+                        df['Meeting Date'] = pd.to_datetime(df['Meeting Date'], errors='coerce', format='ISO8601')
                     if 'Follow up Date' in df.columns:
-                        df['Follow up Date'] = pd.to_datetime(df['Follow up Date'], errors='coerce')
+                        df['Follow up Date'] = pd.to_datetime(df['Follow up Date'], errors='coerce', format='ISO8601')
                     # Convert time to string format
                     if 'Start Time' in df.columns:
                         df['Start Time'] = df['Start Time'].apply(
@@ -175,68 +282,175 @@ def load_meetings_from_supabase():
                         )
                     return df
                 else:
-                    return pd.DataFrame(columns=[
-                        'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                        'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                        'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                        'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                        'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-                    ])
+                    return pd.DataFrame(columns=list(TEMPLATE_COLUMNS))
     except Exception as e:
         st.error(f"Error loading from Supabase: {e}")
         return None
 
+def to_storage_frame(df):
+    """Normalize column types so the meetings DataFrame can be written to Parquet"""
+    df = df.copy()
+    if 'Meeting ID' in df.columns:
+        df['Meeting ID'] = pd.to_numeric(df['Meeting ID'], errors='coerce').astype('Int64')
+    for col in ('Meeting Date', 'Follow up Date'):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    # Mixed object columns (e.g. time cells next to strings) are stored as text, keeping NaN
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+def list_insert_files():
+    """Return pending insert files in the order they were written"""
+    if not os.path.isdir(INSERTS_DIR):
+        return []
+    return sorted(os.path.join(INSERTS_DIR, name) for name in os.listdir(INSERTS_DIR) if name.endswith('.parquet'))
+
+def write_meetings_file(df):
+    """Write the meetings DataFrame to the local Parquet data file"""
+    to_storage_frame(df).to_parquet(DATA_FILE, engine='pyarrow', compression='snappy', index=False)
+    # The full rewrite already contains every pending insert
+    for path in list_insert_files():
+        os.remove(path)
+    _load_meetings_cached.clear()
+
+def write_insert_file(row_df):
+    """Write newly added meeting rows as a small Parquet file next to the main data file"""
+    os.makedirs(INSERTS_DIR, exist_ok=True)
+    # Nanosecond prefix keeps files sorted by insertion order
+    path = os.path.join(INSERTS_DIR, f"{time.time_ns()}_{uuid.uuid4().hex[:8]}.parquet")
+    to_storage_frame(row_df).to_parquet(path, engine='pyarrow', compression='snappy', index=False)
+
+def compact_meetings_file():
+    """Merge pending insert files into the main data file"""
+    df = load_meetings_file()
+    if df is not None:
+        write_meetings_file(df)
+
+def read_meetings_excel(path):
+    """Read a meetings workbook, keeping only template columns"""
+    # 'Location' is kept so the caller can rename it to 'Website'
+    wanted = set(TEMPLATE_COLUMNS) | {'Location'}
+    # Text columns are read as str to skip type inference; ID and date columns are left to pandas
+    text_columns = {col: str for col in TEMPLATE_COLUMNS if col != 'Meeting ID' and 'Date' not in col}
+    return pd.read_excel(
+        path,
+        engine='openpyxl',
+        usecols=lambda col: col in wanted,
+        dtype={**text_columns, 'Location': str},
+    )
+
+def write_excel(df, target):
+    """Write df to an .xlsx path or buffer with a write-only openpyxl workbook, streaming rows instead of building a cell tree"""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    header_font = Font(bold=True)
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(ws, value=str(col))
+        cell.font = header_font
+        header.append(cell)
+    ws.append(header)
+    # Missing values become empty cells
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(target)
+
+@st.cache_data(show_spinner=False)
+def build_meeting_template_bytes(today):
+    """Import template workbook with one sample row, built once per day instead of on every rerun"""
+    # Create template dataframe with all template columns
+    template_df = pd.DataFrame(columns=list(TEMPLATE_COLUMNS))
+    # Add sample row
+    template_df = pd.concat([template_df, pd.DataFrame([{
+        'Meeting ID': 1,
+        'Meeting Title': 'Sample Meeting',
+        'Organization': 'Sample Org',
+        'Client': 'Sample Client',
+        'Stakeholder Name': 'Jane Smith',
+        'Purpose': 'Sample Purpose',
+        'Agenda': 'Sample agenda items',
+        'Meeting Date': today,
+        'Start Time': '10:00:00',
+        'Time Zone': 'UTC',
+        'Meeting Type': 'Virtual',
+        'Meeting Link': 'https://meet.example.com',
+        'Website': '',
+        'Status': 'Upcoming',
+        'Priority': 'Medium',
+        'Attendees': 'Team Member 1, Team Member 2',
+        'Internal External Guests': 'Client A, Client B',
+        'Notes': 'Sample notes',
+        'Next Action': 'Follow up required',
+        'Follow up Date': '',
+        'Reminder Sent': 'No',
+        'Calendar Sync': 'No',
+        'Calendar Event Title': 'Sample Meeting'
+    }])], ignore_index=True)
+    
+    template_buffer = io.BytesIO()
+    write_excel(template_df, template_buffer)
+    return template_buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def read_uploaded_excel(data, header):
+    """Parse an uploaded workbook, keyed on its bytes so reruns while the file stays in the uploader reuse the parse"""
+    return pd.read_excel(io.BytesIO(data), header=header)
+
+def migrate_excel_to_parquet():
+    """One-time migration: convert the legacy Excel file to the Parquet data file"""
+    if os.path.exists(DATA_FILE) or not os.path.exists(EXCEL_FILE):
+        return
+    df = read_meetings_excel(EXCEL_FILE)
+    # Backwards compatibility: rename Location to Website if present
+    if 'Location' in df.columns and 'Website' not in df.columns:
+        df = df.rename(columns={'Location': 'Website'})
+    write_meetings_file(df)
+
+@st.cache_data(show_spinner=False)
+def _load_meetings_cached(path, mtime, insert_files):
+    """Read the meetings Parquet file plus pending inserts - cached until either changes"""
+    frames = []
+    if os.path.exists(path):
+        frames.append(pd.read_parquet(path, engine='pyarrow'))
+    frames.extend(pd.read_parquet(insert_path, engine='pyarrow') for insert_path in insert_files)
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    # Ensure all template columns exist in one reindex, keeping any extra columns after them
+    extra_columns = [col for col in df.columns if col not in TEMPLATE_COLUMNS]
+    df = df.reindex(columns=list(TEMPLATE_COLUMNS) + extra_columns, fill_value='')
+    
+    # Parquet preserves dtypes, so dates come back as datetime64 without coercion
+    return df
+
+def load_meetings_file():
+    """Load meetings from the local data file, migrating the legacy Excel file if needed"""
+    migrate_excel_to_parquet()
+    insert_files = tuple(list_insert_files())
+    if not os.path.exists(DATA_FILE):
+        if not insert_files:
+            return None
+        return _load_meetings_cached(DATA_FILE, 0, insert_files)
+    return _load_meetings_cached(DATA_FILE, os.path.getmtime(DATA_FILE), insert_files)
+
 def load_meetings():
-    """Load meetings from Supabase (if available) or Excel file"""
+    """Load meetings from Supabase (if available) or the local data file"""
     # Try Supabase first if enabled
     if get_use_supabase() and init_db_pool():
         df = load_meetings_from_supabase()
         if df is not None:
             return df
     
-    # Fallback to Excel
-    if os.path.exists(EXCEL_FILE):
+    # Fallback to local data file
+    if os.path.exists(DATA_FILE) or os.path.exists(EXCEL_FILE) or list_insert_files():
         try:
-            df = pd.read_excel(EXCEL_FILE)
-            # Backwards compatibility: rename Location to Website if present
-            if 'Location' in df.columns and 'Website' not in df.columns:
-                df = df.rename(columns={'Location': 'Website'})
-            # Ensure all template columns exist
-            template_columns = [
-                'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-            ]
-            for col in template_columns:
-                if col not in df.columns:
-                    df[col] = ''
-            
-            # Convert date and time columns if they exist
-            if 'Meeting Date' in df.columns:
-                df['Meeting Date'] = pd.to_datetime(df['Meeting Date'], errors='coerce')
-            if 'Follow up Date' in df.columns:
-                df['Follow up Date'] = pd.to_datetime(df['Follow up Date'], errors='coerce')
-            
-            return df
+            return load_meetings_file()
         except Exception as e:
             st.error(f"Error loading meetings: {e}")
-            return pd.DataFrame(columns=[
-                'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-            ])
+            return pd.DataFrame(columns=list(TEMPLATE_COLUMNS))
     else:
-        return pd.DataFrame(columns=[
-            'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-            'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-            'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-            'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-            'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-        ])
+        return pd.DataFrame(columns=list(TEMPLATE_COLUMNS))
 
 def sync_excel_to_supabase(df=None):
     """Sync Excel data to Supabase - used on initial load"""
@@ -249,7 +463,7 @@ def sync_excel_to_supabase(df=None):
             return True  # No Excel file to sync
         
         try:
-            df = pd.read_excel(EXCEL_FILE)
+            df = read_meetings_excel(EXCEL_FILE)
             if df.empty:
                 return True  # Empty Excel file
         except Exception as e:
@@ -520,8 +734,11 @@ def delete_meeting_from_supabase(meeting_id):
 
 def save_meetings(df):
     """Save meetings to Supabase (if available) and/or Excel file - Real-time sync"""
+    bump_meetings_version()
+    # A full save may carry imported IDs; recount on the next insert
+    st.session_state.max_meeting_id = None
     if df.empty:
-        # If dataframe is empty, clear Supabase and Excel
+        # If dataframe is empty, clear Supabase and the local data file
         if get_use_supabase() and init_db_pool():
             try:
                 with get_db_connection() as conn:
@@ -531,15 +748,8 @@ def save_meetings(df):
                 pass  # Ignore errors when clearing
         
         try:
-            # Create empty Excel with columns
-            template_columns = [
-                'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-            ]
-            pd.DataFrame(columns=template_columns).to_excel(EXCEL_FILE, index=False)
+            # Create empty data file with columns
+            write_meetings_file(pd.DataFrame(columns=list(TEMPLATE_COLUMNS)))
         except:
             pass
         return True
@@ -602,61 +812,144 @@ def save_meetings(df):
             st.error(f"Error syncing to Supabase: {e}")
             supabase_success = False
     
-    # Always save to Excel as backup
+    # Always save to the local data file as backup
     try:
-        df.to_excel(EXCEL_FILE, index=False)
+        write_meetings_file(df)
     except Exception as e:
         if not get_use_supabase():
-            st.error(f"Error saving meetings to Excel: {e}")
+            st.error(f"Error saving meetings: {e}")
             return False
         else:
-            # If Supabase works but Excel fails, still return success
+            # If Supabase works but the local write fails, still return success
             pass
     
     return supabase_success if get_use_supabase() and init_db_pool() else True
 
-def calculate_status(row):
-    """Calculate meeting status based on current time"""
-    now = datetime.now()
+def update_meeting(df, idx):
+    """Save one edited meeting row - only that row is synced to Supabase"""
+    bump_meetings_version()
+    supabase_success = True
     
-    # Handle Meeting Date and Start Time
-    meeting_date = pd.to_datetime(row.get('Meeting Date', pd.NaT), errors='coerce')
-    start_time_str = str(row.get('Start Time', ''))
+    # Update just the edited row in Supabase instead of re-syncing every meeting
+    if get_use_supabase() and init_db_pool():
+        supabase_success = save_meeting_to_supabase(df.loc[idx])
     
-    if pd.isna(meeting_date) or not start_time_str or start_time_str.strip() == '':
-        return "Upcoming"  # Default if date/time not available
+    # Always save to the local data file as backup
+    try:
+        write_meetings_file(df)
+    except Exception as e:
+        if not get_use_supabase():
+            st.error(f"Error saving meetings: {e}")
+            return False
+    
+    return supabase_success if get_use_supabase() and init_db_pool() else True
+
+def append_meeting(new_rows):
+    """Save newly added meeting rows (a list of dicts) without rewriting the whole data file"""
+    bump_meetings_version()
+    supabase_success = True
+    
+    # Save only the new rows to Supabase if enabled
+    if get_use_supabase() and init_db_pool():
+        for row in new_rows:
+            if not save_meeting_to_supabase(row):
+                supabase_success = False
     
-    # Try to parse start time
+    # Append to the local data file as backup; the Parquet fragment is the only place a frame is needed
     try:
-        if isinstance(start_time_str, datetime):
-            start_time = start_time_str.time()
-        elif isinstance(start_time_str, str):
-            # Try different time formats
-            for fmt in ['%H:%M:%S', '%H:%M', '%I:%M %p', '%I:%M:%S %p']:
-                try:
-                    start_time = datetime.strptime(start_time_str.strip(), fmt).time()
-                    break
-                except:
-                    continue
-            else:
-                return "Upcoming"  # Could not parse time
+        write_insert_file(meeting_rows_frame(new_rows))
+        if len(list_insert_files()) > INSERTS_COMPACT_THRESHOLD:
+            compact_meetings_file()
         else:
-            return "Upcoming"
-        
-        # Combine date and time
-        start_datetime = datetime.combine(meeting_date.date(), start_time)
-        
-        # Since template doesn't have end time, assume 1 hour duration
-        end_datetime = start_datetime + timedelta(hours=1)
-        
-        if now < start_datetime:
-            return "Upcoming"
-        elif start_datetime <= now < end_datetime:
-            return "Ongoing"
-        else:
-            return "Ended"
-    except:
+            _load_meetings_cached.clear()
+    except Exception as e:
+        if not get_use_supabase():
+            st.error(f"Error saving meetings: {e}")
+            return False
+    
+    return supabase_success if get_use_supabase() and init_db_pool() else True
+
+def _pick_time_format(time_str):
+    """Pick the TIME_FORMATS entry matching a time string by inspecting it, instead of probing each one"""
+    upper = time_str.upper()
+    ampm = 'AM' in upper or 'PM' in upper
+    seconds = time_str.count(':') == 2
+    if ampm:
+        return '%I:%M:%S %p' if seconds else '%I:%M %p'
+    return '%H:%M:%S' if seconds else '%H:%M'
+
+def _parse_time(time_str):
+    """Parse a stored time string into a time object, or None if it isn't one"""
+    return _parse_time_text(str(time_str).strip())
+
+@lru_cache(maxsize=4096)
+def _parse_time_text(time_str):
+    """strptime behind _parse_time - meetings reuse a handful of slot times, so each is parsed once"""
+    if ':' not in time_str:
+        return None
+    try:
+        return datetime.strptime(time_str, _pick_time_format(time_str)).time()
+    except ValueError:
+        return None
+
+def status_from_datetime(meeting_date, start_time):
+    """Calculate meeting status from a date and a time object based on current time"""
+    if not meeting_date or not start_time:
+        return "Upcoming"  # Default if date/time not available
+    start_datetime = datetime.combine(meeting_date, start_time)
+    
+    # Since template doesn't have end time, assume 1 hour duration
+    end_datetime = start_datetime + MEETING_DURATION
+    
+    now = datetime.now()
+    if now < start_datetime:
         return "Upcoming"
+    elif now < end_datetime:
+        return "Ongoing"
+    else:
+        return "Ended"
+
+def meeting_start_datetimes(df):
+    """Start datetime of every meeting (Meeting Date + Start Time), NaT where either is missing or unparseable"""
+    meeting_dates = pd.to_datetime(df['Meeting Date'], errors='coerce')
+    if meeting_dates.dt.tz is not None:
+        meeting_dates = meeting_dates.dt.tz_localize(None)
+    
+    # Parse each distinct start time once - meetings reuse a handful of slot times,
+    # so this is a few parses however long the table gets
+    codes, unique_strs = pd.factorize(df['Start Time'].astype(str).str.strip())
+    unique_strs = pd.Series(unique_strs, dtype=object)
+    unique_times = pd.to_datetime(unique_strs, format=TIME_FORMATS[0], errors='coerce')
+    for fmt in TIME_FORMATS[1:]:
+        missing = unique_times.isna()
+        if not missing.any():
+            break
+        unique_times[missing] = pd.to_datetime(unique_strs[missing], format=fmt, errors='coerce')
+    # Time of day per distinct string, plus a trailing NaT for missing values (code -1)
+    unique_offsets = (unique_times - unique_times.dt.normalize()).to_numpy()
+    unique_offsets = np.append(unique_offsets, np.timedelta64('NaT', 'ns').astype(unique_offsets.dtype))
+    time_offsets = pd.Series(unique_offsets[codes], index=df.index)
+    
+    return meeting_dates.dt.normalize() + time_offsets
+
+def compute_statuses(df):
+    """Calculate meeting status for every row at once"""
+    if 'Meeting Date' not in df.columns or 'Start Time' not in df.columns:
+        return pd.Series("Upcoming", index=df.index, dtype=object)
+    
+    now = pd.Timestamp(datetime.now())
+    # Template has no end time, so assume 1 hour duration
+    start_datetimes = meeting_start_datetimes(df)
+    end_datetimes = start_datetimes + MEETING_DURATION
+    
+    statuses = np.select(
+        [now < start_datetimes, now < end_datetimes],
+        ["Upcoming", "Ongoing"],
+        default="Ended"
+    ).astype(object)
+    # Missing date or unparseable time defaults to Upcoming
+    statuses[start_datetimes.isna().to_numpy()] = "Upcoming"
+    return pd.Series(statuses, index=df.index)
 
 def get_next_meeting_id_from_supabase():
     """Get next meeting ID from Supabase"""
@@ -698,38 +991,45 @@ def get_next_meeting_id(df):
     except:
         return 1
 
-def update_all_statuses(df):
-    """Update status for all meetings and save to Excel"""
-    if not df.empty:
-        if 'Status' in df.columns:
-            # Preserve manually set statuses
-            manually_set_ids = set()
-            if 'manually_set_statuses' in st.session_state:
-                manually_set_ids = set(st.session_state.manually_set_statuses.keys())
-            
-            # Only update status for meetings that are not manually set
-            if 'Meeting ID' in df.columns:
-                mask = ~df['Meeting ID'].isin(manually_set_ids)
-            else:
-                # If no Meeting ID, only update empty statuses
-                mask = df['Status'].isna() | (df['Status'].astype(str).str.strip() == '')
-            
-            if mask.any():
-                df.loc[mask, 'Status'] = df.loc[mask].apply(calculate_status, axis=1)
-            
-            # Restore manually set statuses
-            if 'manually_set_statuses' in st.session_state and 'Meeting ID' in df.columns:
-                for meeting_id, status in st.session_state.manually_set_statuses.items():
-                    mask = df['Meeting ID'] == meeting_id
-                    if mask.any():
-                        df.loc[mask, 'Status'] = status
-        
-        save_meetings(df)
-    return df
+def max_meeting_id(df):
+    """Highest numeric Meeting ID in a DataFrame, 0 if there is none"""
+    if df.empty or 'Meeting ID' not in df.columns:
+        return 0
+    max_id = pd.to_numeric(df['Meeting ID'], errors='coerce').max()
+    return 0 if pd.isna(max_id) else int(max_id)
+
+def allocate_meeting_id():
+    """Hand out the next meeting ID - a session counter locally, a query against Supabase"""
+    # Other sessions may insert into Supabase, so the database stays the source of truth there
+    if get_use_supabase() and init_db_pool():
+        return get_next_meeting_id_from_supabase()
+    if st.session_state.max_meeting_id is None:
+        st.session_state.max_meeting_id = max_meeting_id(get_meetings_df())
+    st.session_state.max_meeting_id += 1
+    return st.session_state.max_meeting_id
+
+def meeting_rows_frame(rows):
+    """Meetings frame from a list of row dicts, in template column order with MEETING_DTYPES applied"""
+    return pd.DataFrame(rows, columns=list(TEMPLATE_COLUMNS)).astype(MEETING_DTYPES)
+
+def get_meetings_df():
+    """Return the session's meetings DataFrame, folding in rows added since the last read"""
+    pending = st.session_state.pending_inserts
+    if pending:
+        new_rows = meeting_rows_frame(pending)
+        if st.session_state.meetings_df.empty:
+            st.session_state.meetings_df = new_rows
+        else:
+            st.session_state.meetings_df = pd.concat([st.session_state.meetings_df, new_rows], ignore_index=True)
+        st.session_state.pending_inserts = []
+        categorize_meeting_columns(st.session_state.meetings_df)
+    return st.session_state.meetings_df
 
 def load_data():
     """Load data into session state with automatic sync"""
     if not st.session_state.data_loaded:
+        # Pending rows are already in storage, so a reload picks them up
+        st.session_state.pending_inserts = []
         # Try to load from Supabase first
         if get_use_supabase() and init_db_pool():
             supabase_df = load_meetings_from_supabase()
@@ -737,127 +1037,270 @@ def load_data():
             # If Supabase has data, use it
             if supabase_df is not None and not supabase_df.empty:
                 st.session_state.meetings_df = supabase_df
-                # Sync to Excel as backup
+                # Sync to local data file as backup
                 try:
-                    st.session_state.meetings_df.to_excel(EXCEL_FILE, index=False)
+                    write_meetings_file(st.session_state.meetings_df)
                 except:
                     pass
-            # If Supabase is empty, use Excel data (but don't auto-sync)
+            # If Supabase is empty, use local data (but don't auto-sync)
             elif supabase_df is not None and supabase_df.empty:
-                excel_df = None
-                if os.path.exists(EXCEL_FILE):
-                    try:
-                        excel_df = pd.read_excel(EXCEL_FILE)
-                        if 'Location' in excel_df.columns and 'Website' not in excel_df.columns:
-                            excel_df = excel_df.rename(columns={'Location': 'Website'})
-                        # Ensure all template columns exist
-                        template_columns = [
-                            'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                            'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                            'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                            'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                            'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-                        ]
-                        for col in template_columns:
-                            if col not in excel_df.columns:
-                                excel_df[col] = ''
-                        
-                        # Convert date and time columns
-                        if 'Meeting Date' in excel_df.columns:
-                            excel_df['Meeting Date'] = pd.to_datetime(excel_df['Meeting Date'], errors='coerce')
-                        if 'Follow up Date' in excel_df.columns:
-                            excel_df['Follow up Date'] = pd.to_datetime(excel_df['Follow up Date'], errors='coerce')
-                    except:
-                        excel_df = None
+                try:
+                    local_df = load_meetings_file()
+                except:
+                    local_df = None
                 
-                if excel_df is not None and not excel_df.empty:
-                    st.session_state.meetings_df = excel_df
+                if local_df is not None and not local_df.empty:
+                    st.session_state.meetings_df = local_df
                 else:
-                    st.session_state.meetings_df = pd.DataFrame(columns=[
-                        'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                        'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                        'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                        'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                        'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-                    ])
+                    st.session_state.meetings_df = pd.DataFrame(columns=list(TEMPLATE_COLUMNS))
             else:
-                # Supabase connection failed, fall back to Excel
+                # Supabase connection failed, fall back to local data file
                 st.session_state.meetings_df = load_meetings()
         else:
-            # Supabase not enabled or connection failed, use Excel
+            # Supabase not enabled or connection failed, use local data file
             st.session_state.meetings_df = load_meetings()
         
+        coerce_meeting_ids(st.session_state.meetings_df)
+        coerce_meeting_dates(st.session_state.meetings_df)
+        st.session_state.max_meeting_id = max_meeting_id(st.session_state.meetings_df)
         st.session_state.data_loaded = True
+        bump_meetings_version()
+    
+    # Enumeration columns as categoricals (re-applied after a concat or import left them as plain objects)
+    categorize_meeting_columns(st.session_state.meetings_df)
     
     # Only recalculate status for empty/NaN statuses on initial load
     # Preserve all manually set statuses (they are saved to Excel/Supabase)
     if not st.session_state.meetings_df.empty:
         if 'Status' in st.session_state.meetings_df.columns:
+            df = st.session_state.meetings_df
+            current = df['Status'].astype(object)
             # Only recalculate if status is empty/NaN (not set)
-            mask = st.session_state.meetings_df['Status'].isna() | (st.session_state.meetings_df['Status'].astype(str).str.strip() == '')
-            if mask.any():
-                st.session_state.meetings_df.loc[mask, 'Status'] = st.session_state.meetings_df.loc[mask].apply(calculate_status, axis=1)
+            wanted = current.copy()
+            blank = current.isna() | (current.astype(str).str.strip() == '')
+            if blank.any():
+                wanted[blank] = compute_statuses(df.loc[blank])
             
             # Restore manually set statuses from session state if they exist
-            if 'manually_set_statuses' in st.session_state and 'Meeting ID' in st.session_state.meetings_df.columns:
-                for meeting_id, status in st.session_state.manually_set_statuses.items():
-                    mask = st.session_state.meetings_df['Meeting ID'] == meeting_id
-                    if mask.any():
-                        st.session_state.meetings_df.loc[mask, 'Status'] = status
+            overrides = st.session_state.get('manually_set_statuses')
+            if overrides and 'Meeting ID' in df.columns:
+                wanted = df['Meeting ID'].map(overrides).fillna(wanted)
             
+            # One write for both, covering only the rows that actually change
+            changed = (wanted != current) & wanted.notna()
+            if changed.any():
+                set_meeting_rows(df, df.index[changed], wanted[changed].to_frame('Status'))
+                bump_meetings_version()
+
+
+def categorize_meeting_columns(df):
+    """Store the enumeration columns as categoricals - no-op for columns that already are"""
+    for col, known in MEETING_CATEGORIES.items():
+        if col not in df.columns:
+            continue
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype) and '' in values.cat.categories and set(known).issubset(values.cat.categories):
+            continue
+        values = values.astype(object)
+        values = values.where(values.isna(), values.astype(str))
+        extra = sorted(set(values.dropna()) - set(known) - {''})
+        df[col] = pd.Categorical(values, categories=list(known) + [''] + extra)
+    return df
+
+def set_meeting_values(df, idx, values):
+    """Set several cells of one row in a single .loc assignment, extending categories where needed"""
+    for col, value in values.items():
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype) and pd.notna(value) and value not in df[col].cat.categories:
+            df[col] = df[col].cat.add_categories([value])
+    df.loc[idx, list(values)] = list(values.values())
+
+def set_meeting_rows(df, index, rows):
+    """Write rows into df at the given index labels, one vectorized assignment per column"""
+    for col in rows.columns:
+        values = rows[col].to_numpy()
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+            new_categories = pd.Index(pd.unique(rows[col].dropna())).difference(df[col].cat.categories)
+            if len(new_categories):
+                df[col] = df[col].cat.add_categories(new_categories)
+        df.loc[index, col] = values
+
+def meeting_values_changed(df, idx, values):
+    """Whether writing values into row idx would change any cell - blank and missing count as equal"""
+    row = df.loc[idx]
+    for col, value in values.items():
+        if col not in df.columns:
+            return True
+        current = row[col]
+        current_blank = pd.isna(current) or current == ''
+        value_blank = pd.isna(value) or value == ''
+        if current_blank and value_blank:
+            continue
+        if current_blank or value_blank or current != value:
+            return True
+    return False
+
+def to_naive_dates(values):
+    """Coerce a date column to timezone-naive datetime64, skipping work if it already is"""
+    if pd.api.types.is_datetime64_dtype(values):
+        return values
+    dates = pd.to_datetime(values, errors='coerce')
+    # Remove timezone if present - convert to UTC first then remove timezone
+    try:
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_convert('UTC').dt.tz_localize(None)
+    except (AttributeError, TypeError):
+        # If already naive or conversion fails, use as-is
+        pass
+    return dates
+
+def to_date(value):
+    """Date part of a stored date value, or None - loaded dates are already Timestamps and skip parsing"""
+    if isinstance(value, datetime) and pd.notna(value):
+        return value.date()
+    if isinstance(value, str):
+        # ISO text (database rows, earlier exports) parses in C without pandas' format inference
+        try:
+            return datetime.fromisoformat(value.strip()).date()
+        except ValueError:
+            pass
+    parsed = pd.to_datetime(value, errors='coerce')
+    return None if pd.isna(parsed) else parsed.date()
+
+def coerce_meeting_ids(df):
+    """Hold Meeting ID as nullable Int64 so lookups and import matching compare integers, not strings"""
+    if 'Meeting ID' in df.columns:
+        df['Meeting ID'] = pd.to_numeric(df['Meeting ID'], errors='coerce').astype('Int64')
+    return df
+
+def coerce_meeting_dates(df):
+    """Convert the date columns once after loading so filters can compare them directly"""
+    for col in ('Meeting Date', 'Follow up Date'):
+        if col in df.columns:
+            df[col] = to_naive_dates(df[col])
+    return df
+
+def build_search_blob(df):
+    """Lowercased text of all searchable columns per row, joined with a separator no query contains
+
+    Held as an Arrow-backed string Series so the per-keystroke str.contains runs in Arrow's kernels
+    rather than over Python string objects.
+    """
+    blob = pd.Series('', index=df.index, dtype=SEARCH_BLOB_DTYPE)
+    for col in SEARCH_COLUMNS:
+        if col in df.columns:
+            blob = blob + '\x1f' + df[col].astype(SEARCH_BLOB_DTYPE).fillna('')
+    return blob.str.lower()
+
+def get_meetings_search_blob():
+    """Search blob for the session's meetings_df, rebuilt only when the data changes"""
+    df = st.session_state.meetings_df
+    return _memoize_on_version('search_blob', (st.session_state.meetings_version, len(df)), lambda: build_search_blob(df))
 
-def filter_meetings(df, status_filter, date_start, date_end, search_text):
+def get_meeting_index_by_id():
+    """Map each Meeting ID (and its string form) to its meetings_df index, rebuilt only when the data changes"""
+    df = st.session_state.meetings_df
+    def build():
+        index_by_id = {}
+        if 'Meeting ID' in df.columns:
+            for meeting_id, idx in zip(df['Meeting ID'].tolist(), df.index):
+                # First occurrence wins, as with the boolean-mask lookup this replaces
+                index_by_id.setdefault(meeting_id, idx)
+                index_by_id.setdefault(str(meeting_id), idx)
+        return index_by_id
+    return _memoize_on_version('index_by_id', (st.session_state.meetings_version, len(df)), build)
+
+def get_meetings_by_recency():
+    """meetings_df index labels ordered newest Meeting Date first, rebuilt only when the data changes"""
+    df = st.session_state.meetings_df
+    def build():
+        if 'Meeting Date' not in df.columns:
+            return df.index
+        return to_naive_dates(df['Meeting Date']).sort_values(ascending=False, kind='stable').index
+    return _memoize_on_version('index_by_recency', (st.session_state.meetings_version, len(df)), build)
+
+def get_edit_select_options(search_text):
+    """Edit page selectbox choices for a search - ({label: Meeting ID}, {label: index}, match count) - rebuilt only when the data or search changes"""
+    df = st.session_state.meetings_df
+    def build():
+        # The most recent meetings, narrowed by the search if there is one
+        candidate_index = get_meetings_by_recency()
+        if search_text:
+            matches = get_meetings_search_blob().str.contains(search_text.lower(), regex=False, na=False)
+            candidate_index = candidate_index[matches.loc[candidate_index].to_numpy(dtype=bool)]
+        match_count = len(candidate_index)
+        candidate_index = candidate_index[:EDIT_SELECT_LIMIT]
+        
+        label_columns = df.loc[candidate_index].reindex(
+            columns=['Organization', 'Stakeholder Name', 'Meeting Date', 'Meeting ID'], fill_value='N/A'
+        )
+        if 'Meeting ID' not in df.columns:
+            label_columns['Meeting ID'] = label_columns.index
+        # Build all labels column-wise: "org - stakeholder - date"
+        date_strs = to_naive_dates(label_columns['Meeting Date']).dt.strftime('%Y-%m-%d').fillna('N/A')
+        labels = (
+            label_columns['Organization'].astype(str).fillna('nan') + ' - '
+            + label_columns['Stakeholder Name'].astype(str).fillna('nan') + ' - '
+            + date_strs
+        ).tolist()
+        meeting_options = dict(zip(labels, label_columns['Meeting ID'].tolist()))
+        meeting_index_map = dict(zip(labels, label_columns.index))  # Map label to DataFrame index
+        return meeting_options, meeting_index_map, match_count
+    return _memoize_on_version('edit_select_options', (st.session_state.meetings_version, len(df), search_text), build)
+
+def get_edit_form_defaults(idx, meeting):
+    """Edit form widget values for one meeting row dict, parsed once per data version"""
+    def build():
+        defaults = {}
+        for col, default in EDIT_FORM_TEXT_DEFAULTS.items():
+            value = meeting.get(col)
+            defaults[col] = default if value is None or pd.isna(value) else str(value)
+        defaults['Meeting Date'] = to_date(meeting.get('Meeting Date'))
+        defaults['Start Time'] = _parse_time(meeting.get('Start Time', ''))
+        defaults['Follow up Date'] = to_date(meeting.get('Follow up Date'))
+        return defaults
+    return _memoize_on_version('edit_form_defaults', (st.session_state.meetings_version, idx), build)
+
+def get_filtered_meetings(status_filter, date_start, date_end, search_text):
+    """filter_meetings over the session's meetings, reused while the data and filter inputs are unchanged"""
+    df = get_meetings_df()
+    # Filters at their defaults select every row - hand back the frame itself without a pass over it
+    if status_filter == "All" and not date_start and not date_end and not search_text:
+        return df
+    key = (st.session_state.meetings_version, len(df), status_filter, date_start, date_end, search_text)
+    return _memoize_on_version(
+        'filtered_meetings', key,
+        lambda: filter_meetings(df, status_filter, date_start, date_end, search_text, search_blob=get_meetings_search_blob())
+    )
+
+def filter_meetings(df, status_filter, date_start, date_end, search_text, search_blob=None):
     """Filter meetings based on criteria"""
-    filtered_df = df.copy()
+    # Compose one boolean mask and slice once at the end
+    mask = np.ones(len(df), dtype=bool)
     
     # Status filter
-    if status_filter != "All" and 'Status' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Status'] == status_filter]
+    if status_filter != "All" and 'Status' in df.columns:
+        mask &= (df['Status'] == status_filter).to_numpy()
     
     # Date range filter
-    if date_start and 'Meeting Date' in filtered_df.columns:
-        # Convert Meeting Date to timezone-naive for comparison
-        meeting_dates = pd.to_datetime(filtered_df['Meeting Date'], errors='coerce')
-        # Remove timezone if present - convert to UTC first then remove timezone
-        try:
-            if meeting_dates.dt.tz is not None:
-                meeting_dates = meeting_dates.dt.tz_convert('UTC').dt.tz_localize(None)
-        except (AttributeError, TypeError):
-            # If already naive or conversion fails, use as-is
-            pass
-        # Convert date_start to datetime (already naive)
-        date_start_dt = pd.to_datetime(date_start)
-        filtered_df = filtered_df[meeting_dates >= date_start_dt]
-    
-    if date_end and 'Meeting Date' in filtered_df.columns:
-        # Convert Meeting Date to timezone-naive for comparison
-        meeting_dates = pd.to_datetime(filtered_df['Meeting Date'], errors='coerce')
-        # Remove timezone if present - convert to UTC first then remove timezone
-        try:
-            if meeting_dates.dt.tz is not None:
-                meeting_dates = meeting_dates.dt.tz_convert('UTC').dt.tz_localize(None)
-        except (AttributeError, TypeError):
-            # If already naive or conversion fails, use as-is
-            pass
-        # Add end of day to date_end (already naive)
-        date_end_datetime = pd.to_datetime(date_end) + timedelta(days=1) - timedelta(seconds=1)
-        filtered_df = filtered_df[meeting_dates <= date_end_datetime]
+    if (date_start or date_end) and 'Meeting Date' in df.columns:
+        # Already datetime64 after load_data; only coerces if a write left mixed values
+        meeting_dates = to_naive_dates(df['Meeting Date'])
+        if date_start:
+            # Convert date_start to datetime (already naive)
+            date_start_dt = pd.to_datetime(date_start)
+            mask &= (meeting_dates >= date_start_dt).to_numpy()
+        if date_end:
+            # Add end of day to date_end (already naive)
+            date_end_datetime = pd.to_datetime(date_end) + timedelta(days=1) - timedelta(seconds=1)
+            mask &= (meeting_dates <= date_end_datetime).to_numpy()
     
     # Search filter
     if search_text:
-        search_text_lower = search_text.lower()
-        search_mask = pd.Series([False] * len(filtered_df))
-        
-        # Search in multiple columns
-        search_columns = ['Meeting Title', 'Organization', 'Client', 'Stakeholder Name', 
-                         'Purpose', 'Attendees', 'Internal External Guests', 'Notes']
-        for col in search_columns:
-            if col in filtered_df.columns:
-                search_mask |= filtered_df[col].astype(str).str.lower().str.contains(search_text_lower, na=False)
-        
-        filtered_df = filtered_df[search_mask]
+        if search_blob is None:
+            search_blob = build_search_blob(df)
+        mask &= search_blob.str.contains(search_text.lower(), regex=False, na=False).to_numpy(dtype=bool)
     
-    return filtered_df
+    return df.loc[mask]
 
 # Load data
 load_data()
@@ -897,21 +1340,28 @@ def load_podcast_meetings_from_supabase():
                 if rows:
                     df = pd.DataFrame(rows)
                     if 'Date' in df.columns:
-                        df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+                        df['Date'] = pd.to_datetime(df['Date'], errors='coerce', format='ISO8601')
                     if 'Time' in df.columns:
                         df['Time'] = df['Time'].apply(
                             lambda x: str(x).split('.')[0] if pd.notna(x) and x != '' else ''
                         )
                     return df
                 else:
-                    return pd.DataFrame(columns=[
-                        'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                        'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-                    ])
+                    return pd.DataFrame(columns=list(PODCAST_TEMPLATE_COLUMNS))
     except Exception as e:
         st.error(f"Error loading podcast meetings from Supabase: {e}")
         return None
 
+@st.cache_data(show_spinner=False)
+def _load_podcast_excel_cached(path, mtime):
+    """Read the podcast Excel file - cached until the file changes"""
+    df = pd.read_excel(path, engine='openpyxl')
+    # Add any missing template columns in one step rather than one insert each
+    df = df.assign(**dict.fromkeys([col for col in PODCAST_TEMPLATE_COLUMNS if col not in df.columns], ''))
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+    return df
+
 def load_podcast_meetings():
     """Load podcast meetings from Supabase (if available) or Excel file"""
     if get_use_supabase() and init_db_pool():
@@ -919,30 +1369,13 @@ def load_podcast_meetings():
         if df is not None:
             return df
     
-    EXCEL_FILE_PODCAST = "Podcast_Meetings_Template.xlsx"
     if os.path.exists(EXCEL_FILE_PODCAST):
         try:
-            df = pd.read_excel(EXCEL_FILE_PODCAST)
-            template_columns = [
-                'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-            ]
-            for col in template_columns:
-                if col not in df.columns:
-                    df[col] = ''
-            if 'Date' in df.columns:
-                df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            return df
-        except Exception as e:
-            return pd.DataFrame(columns=[
-                'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-            ])
+            return _load_podcast_excel_cached(EXCEL_FILE_PODCAST, os.path.getmtime(EXCEL_FILE_PODCAST))
+        except Exception:
+            return pd.DataFrame(columns=list(PODCAST_TEMPLATE_COLUMNS))
     else:
-        return pd.DataFrame(columns=[
-            'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-            'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-        ])
+        return pd.DataFrame(columns=list(PODCAST_TEMPLATE_COLUMNS))
 
 def normalize_podcast_status(status):
     """Normalize podcast status to valid database values"""
@@ -1045,7 +1478,6 @@ def delete_podcast_meeting_from_supabase(podcast_id):
 
 def save_podcast_meetings(df):
     """Save podcast meetings to Supabase (if available) and/or Excel file"""
-    EXCEL_FILE_PODCAST = "Podcast_Meetings_Template.xlsx"
     if df.empty:
         if get_use_supabase() and init_db_pool():
             try:
@@ -1055,13 +1487,10 @@ def save_podcast_meetings(df):
             except Exception:
                 pass
         try:
-            template_columns = [
-                'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-            ]
-            pd.DataFrame(columns=template_columns).to_excel(EXCEL_FILE_PODCAST, index=False)
+            write_excel(pd.DataFrame(columns=list(PODCAST_TEMPLATE_COLUMNS)), EXCEL_FILE_PODCAST)
         except:
             pass
+        _load_podcast_excel_cached.clear()
         return True
     success = True
     supabase_success = True
@@ -1097,10 +1526,25 @@ def save_podcast_meetings(df):
             st.error(f"Error syncing podcast meetings to Supabase: {str(e)}")
             supabase_success = False
     try:
-        df.to_excel(EXCEL_FILE_PODCAST, index=False)
+        write_excel(df, EXCEL_FILE_PODCAST)
+    except Exception as e:
+        st.error(f"Error saving podcast meetings to Excel: {e}")
+        success = False
+    _load_podcast_excel_cached.clear()
+    return success and supabase_success
+
+def append_podcast_meeting(df, new_row):
+    """Save a newly added podcast meeting - upserts only that row instead of re-syncing every row to Supabase"""
+    supabase_success = True
+    if get_use_supabase() and init_db_pool():
+        supabase_success = save_podcast_meeting_to_supabase(new_row)
+    success = True
+    try:
+        write_excel(df, EXCEL_FILE_PODCAST)
     except Exception as e:
         st.error(f"Error saving podcast meetings to Excel: {e}")
         success = False
+    _load_podcast_excel_cached.clear()
     return success and supabase_success
 
 def get_next_podcast_id_from_supabase():
@@ -1155,542 +1599,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Enhanced Professional CSS Styling
-st.markdown("""
-<style>
-    /* Global Variables & Base Styling */
-    :root {
-        --primary-color: #2563eb;
-        --primary-dark: #1e40af;
-        --primary-light: #3b82f6;
-        --secondary-color: #64748b;
-        --success-color: #10b981;
-        --warning-color: #f59e0b;
-        --error-color: #ef4444;
-        --info-color: #06b6d4;
-        --bg-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        --shadow-sm: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
-        --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-        --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
-        --shadow-xl: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-    }
-    
-    /* Main container styling */
-    .main .block-container {
-        padding-top: 3rem;
-        padding-bottom: 3rem;
-        max-width: 1200px;
-    }
-    
-    /* Enhanced Header styling with gradient */
-    h1 {
-        background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-size: 2.5rem;
-        font-weight: 700;
-        padding-bottom: 0.75rem;
-        margin-bottom: 2rem;
-        border-bottom: 3px solid transparent;
-        border-image: linear-gradient(to right, #2563eb, #7c3aed) 1;
-        letter-spacing: -0.5px;
-    }
-    
-    /* Ensure emojis render with native colors */
-    span[style*="Emoji"] {
-        font-family: 'Segoe UI Emoji', 'Apple Color Emoji', 'Noto Color Emoji', 'EmojiOne Color', 'Android Emoji', emoji, sans-serif !important;
-        color: initial !important;
-        background: none !important;
-        -webkit-background-clip: initial !important;
-        -webkit-text-fill-color: initial !important;
-        background-clip: initial !important;
-        text-rendering: optimizeLegibility;
-        -webkit-font-smoothing: antialiased;
-    }
-    
-    /* Prevent gradient from affecting emojis */
-    h1 span[style*="Emoji"] {
-        background: none !important;
-        -webkit-background-clip: initial !important;
-        -webkit-text-fill-color: initial !important;
-        background-clip: initial !important;
-    }
-    
-    /* Table cell text wrapping and truncation - prevent stacking */
-    .stColumn {
-        overflow-wrap: break-word;
-        word-break: break-word;
-        line-height: 1.5 !important;
-        padding: 0.5rem 0.25rem !important;
-        vertical-align: top !important;
-    }
-    
-    /* Ensure table headers are fully visible */
-    small strong {
-        white-space: nowrap;
-        display: block;
-        line-height: 1.4;
-    }
-    
-    /* Prevent text from stacking in table cells */
-    .stColumn small {
-        display: block;
-        line-height: 1.5;
-        word-wrap: break-word;
-        overflow-wrap: break-word;
-        white-space: normal;
-        max-width: 100%;
-    }
-    
-    /* Ensure proper spacing between table rows */
-    hr {
-        margin: 0.5rem 0 !important;
-    }
-    
-    h2 {
-        color: #1e293b;
-        margin-top: 2.5rem;
-        margin-bottom: 1.25rem;
-        font-size: 1.75rem;
-        font-weight: 600;
-        position: relative;
-        padding-left: 1rem;
-    }
-    
-    h2::before {
-        content: '';
-        position: absolute;
-        left: 0;
-        top: 50%;
-        transform: translateY(-50%);
-        width: 4px;
-        height: 80%;
-        background: linear-gradient(180deg, #2563eb, #7c3aed);
-        border-radius: 2px;
-    }
-    
-    h3 {
-        color: #334155;
-        margin-top: 1.75rem;
-        margin-bottom: 1rem;
-        font-size: 1.35rem;
-        font-weight: 600;
-    }
-    
-    /* Professional Sidebar styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
-        border-right: 1px solid #e2e8f0;
-    }
-    
-    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] h1 {
-        background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-size: 1.5rem;
-        font-weight: 700;
-        border: none;
-        padding-bottom: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    
-    /* Enhanced Button styling */
-    .stButton>button {
-        background: linear-gradient(135deg, #2563eb 0%, #1e40af 100%);
-        color: white;
-        border-radius: 10px;
-        border: none;
-        padding: 0.625rem 1.75rem;
-        font-weight: 600;
-        font-size: 0.95rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        box-shadow: var(--shadow-md);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton>button::before {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        border-radius: 50%;
-        background: rgba(255, 255, 255, 0.2);
-        transform: translate(-50%, -50%);
-        transition: width 0.6s, height 0.6s;
-    }
-    
-    .stButton>button:hover::before {
-        width: 300px;
-        height: 300px;
-    }
-    
-    .stButton>button:hover {
-        background: linear-gradient(135deg, #1e40af 0%, #1e3a8a 100%);
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-lg);
-    }
-    
-    .stButton>button:active {
-        transform: translateY(0);
-        box-shadow: var(--shadow-sm);
-    }
-    
-    /* Secondary button with subtle styling */
-    button[kind="secondary"] {
-        background: linear-gradient(135deg, #64748b 0%, #475569 100%);
-        color: white;
-        box-shadow: var(--shadow-md);
-    }
-    
-    button[kind="secondary"]:hover {
-        background: linear-gradient(135deg, #475569 0%, #334155 100%);
-        box-shadow: var(--shadow-lg);
-    }
-    
-    /* Enhanced Alert Messages with icons */
-    .stSuccess {
-        background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);
-        border-left: 5px solid #10b981;
-        color: #065f46;
-        padding: 1.25rem 1.5rem;
-        border-radius: 10px;
-        box-shadow: var(--shadow-md);
-        font-weight: 500;
-    }
-    
-    .stError {
-        background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
-        border-left: 5px solid #ef4444;
-        color: #991b1b;
-        padding: 1.25rem 1.5rem;
-        border-radius: 10px;
-        box-shadow: var(--shadow-md);
-        font-weight: 500;
-    }
-    
-    .stInfo {
-        background: linear-gradient(135deg, #cffafe 0%, #a5f3fc 100%);
-        border-left: 5px solid #06b6d4;
-        color: #164e63;
-        padding: 1.25rem 1.5rem;
-        border-radius: 10px;
-        box-shadow: var(--shadow-md);
-        font-weight: 500;
-    }
-    
-    .stWarning {
-        background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
-        border-left: 5px solid #f59e0b;
-        color: #92400e;
-        padding: 1.25rem 1.5rem;
-        border-radius: 10px;
-        box-shadow: var(--shadow-md);
-        font-weight: 500;
-    }
-    
-    /* Enhanced Metric cards with gradient */
-    [data-testid="stMetricValue"] {
-        background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-size: 2.25rem;
-        font-weight: 700;
-    }
-    
-    [data-testid="stMetricLabel"] {
-        color: #64748b;
-        font-weight: 600;
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    /* Professional Dataframe styling */
-    .dataframe {
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: var(--shadow-lg);
-        border: 1px solid #e2e8f0;
-    }
-    
-    .dataframe thead {
-        background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
-        color: white;
-    }
-    
-    .dataframe thead th {
-        font-weight: 600;
-        padding: 1rem;
-        text-transform: uppercase;
-        font-size: 0.85rem;
-        letter-spacing: 0.5px;
-    }
-    
-    .dataframe tbody tr {
-        transition: all 0.2s ease;
-    }
-    
-    .dataframe tbody tr:hover {
-        background-color: #f1f5f9 !important;
-        transform: scale(1.01);
-        box-shadow: var(--shadow-sm);
-    }
-    
-    .dataframe tbody td {
-        padding: 0.875rem 1rem;
-        border-bottom: 1px solid #e2e8f0;
-    }
-    
-    /* Enhanced Input fields */
-    .stTextInput>div>div>input,
-    .stTextArea>div>div>textarea,
-    .stSelectbox>div>div>select {
-        border-radius: 8px;
-        border: 2px solid #e2e8f0;
-        padding: 0.625rem 0.875rem;
-        font-size: 0.95rem;
-        transition: all 0.3s ease;
-        background-color: #ffffff;
-    }
-    
-    .stTextInput>div>div>input:focus,
-    .stTextArea>div>div>textarea:focus,
-    .stSelectbox>div>div>select:focus {
-        border-color: #2563eb;
-        box-shadow: 0 0 0 4px rgba(37, 99, 235, 0.1);
-        outline: none;
-    }
-    
-    .stTextArea>div>div>textarea {
-        min-height: 100px;
-        resize: vertical;
-    }
-    
-    /* Enhanced Expander styling */
-    .streamlit-expanderHeader {
-        background: linear-gradient(135deg, #f1f5f9 0%, #e2e8f0 100%);
-        border-radius: 8px;
-        padding: 1rem;
-        font-weight: 600;
-        color: #1e293b;
-        border: 1px solid #cbd5e1;
-        transition: all 0.3s ease;
-    }
-    
-    .streamlit-expanderHeader:hover {
-        background: linear-gradient(135deg, #e2e8f0 0%, #cbd5e1 100%);
-        box-shadow: var(--shadow-sm);
-    }
-    
-    /* Enhanced Divider/HR styling */
-    hr {
-        border: none;
-        height: 2px;
-        background: linear-gradient(to right, #2563eb, #7c3aed, transparent);
-        margin: 2.5rem 0;
-        border-radius: 2px;
-    }
-    
-    /* Professional Sidebar radio buttons */
-    [data-testid="stSidebar"] [data-testid="stRadio"] label {
-        padding: 0.75rem 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        transition: all 0.3s ease;
-        background-color: #ffffff;
-        border: 2px solid #e2e8f0;
-        cursor: pointer;
-    }
-    
-    [data-testid="stSidebar"] [data-testid="stRadio"] label:hover {
-        background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%);
-        border-color: #2563eb;
-        transform: translateX(5px);
-        box-shadow: var(--shadow-sm);
-    }
-    
-    [data-testid="stSidebar"] [data-testid="stRadio"] label[data-baseweb="radio"] {
-        background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
-        border-color: #2563eb;
-        box-shadow: var(--shadow-md);
-    }
-    
-    /* Enhanced File uploader */
-    [data-testid="stFileUploader"] {
-        border: 3px dashed #2563eb;
-        border-radius: 12px;
-        padding: 2.5rem;
-        background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%);
-        transition: all 0.3s ease;
-    }
-    
-    [data-testid="stFileUploader"]:hover {
-        border-color: #1e40af;
-        background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
-        box-shadow: var(--shadow-md);
-    }
-    
-    /* Enhanced Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 12px;
-        border-bottom: 2px solid #e2e8f0;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 8px 8px 0 0;
-        padding: 0.75rem 1.5rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: #f1f5f9;
-    }
-    
-    /* Enhanced Date and time inputs */
-    [data-testid="stDateInput"] {
-        border-radius: 8px;
-    }
-    
-    [data-testid="stTimeInput"] {
-        border-radius: 8px;
-    }
-    
-    /* Enhanced Checkbox styling */
-    [data-testid="stCheckbox"] label {
-        font-weight: 500;
-        color: #1e293b;
-        padding: 0.5rem;
-        border-radius: 6px;
-        transition: all 0.2s ease;
-    }
-    
-    [data-testid="stCheckbox"] label:hover {
-        background-color: #f1f5f9;
-    }
-    
-    /* Enhanced Caption styling */
-    .stCaption {
-        color: #64748b;
-        font-style: italic;
-        font-size: 0.875rem;
-    }
-    
-    /* Professional Status badges */
-    .status-badge {
-        padding: 0.375rem 0.875rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 700;
-        display: inline-block;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        box-shadow: var(--shadow-sm);
-    }
-    
-    .status-upcoming {
-        background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);
-        color: #065f46;
-        border: 1px solid #10b981;
-    }
-    
-    .status-ongoing {
-        background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
-        color: #1e40af;
-        border: 1px solid #2563eb;
-    }
-    
-    .status-ended {
-        background: linear-gradient(135deg, #f1f5f9 0%, #e2e8f0 100%);
-        color: #475569;
-        border: 1px solid #94a3b8;
-    }
-    
-    .status-completed {
-        background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
-        color: #92400e;
-        border: 1px solid #f59e0b;
-    }
-    
-    /* Professional Card containers */
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 16px;
-        color: white;
-        box-shadow: var(--shadow-xl);
-        transition: all 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
-    }
-    
-    /* Smooth transitions for all elements */
-    * {
-        transition: background-color 0.2s ease, color 0.2s ease, transform 0.2s ease;
-    }
-    
-    /* Enhanced Form sections */
-    .form-section {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        padding: 2rem;
-        border-radius: 12px;
-        box-shadow: var(--shadow-lg);
-        margin-bottom: 2rem;
-        border: 1px solid #e2e8f0;
-    }
-    
-    /* Subheader styling */
-    .stSubheader {
-        color: #475569;
-        font-weight: 600;
-        font-size: 1.1rem;
-        margin-bottom: 1rem;
-    }
-    
-    /* Selectbox enhanced */
-    .stSelectbox>div>div>select {
-        background-image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='12' height='12' viewBox='0 0 12 12'%3E%3Cpath fill='%232563eb' d='M6 9L1 4h10z'/%3E%3C/svg%3E");
-        background-repeat: no-repeat;
-        background-position: right 0.75rem center;
-        padding-right: 2.5rem;
-    }
-    
-    /* Enhanced number input */
-    [data-testid="stNumberInput"] input {
-        border-radius: 8px;
-        border: 2px solid #e2e8f0;
-    }
-    
-    /* Loading spinner enhancement */
-    .stSpinner>div {
-        border-color: #2563eb transparent transparent transparent;
-    }
-    
-    /* Markdown styling */
-    .stMarkdown {
-        line-height: 1.7;
-    }
-    
-    /* Code block styling */
-    code {
-        background-color: #f1f5f9;
-        padding: 0.25rem 0.5rem;
-        border-radius: 4px;
-        font-size: 0.9em;
-        color: #7c3aed;
-        border: 1px solid #e2e8f0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Enhanced Professional CSS Styling (kept in .streamlit/style.css)
+@st.cache_resource
+def load_css():
+    """Read the app stylesheet once per server process"""
+    return (Path(__file__).parent / ".streamlit" / "style.css").read_text(encoding="utf-8")
+
+# Emitted on every run: Streamlit removes any element a rerun does not emit again
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Enhanced Sidebar Navigation
 st.sidebar.markdown("""
@@ -1791,7 +1707,7 @@ if db_config.get('password'):
         
         # Manual sync button only
         if st.sidebar.button("🔄 Sync", help="Sync current data to Supabase", use_container_width=True, key="sync_btn"):
-            if not st.session_state.meetings_df.empty:
+            if not get_meetings_df().empty:
                 with st.spinner("Syncing to database..."):
                     if save_meetings(st.session_state.meetings_df):
                         st.sidebar.success("✅ Sync completed!")
@@ -1814,6 +1730,10 @@ else:
             with st.sidebar.expander("🔍 Error Details"):
                 st.caption(st.session_state.supabase_error[:300])
 
+# Confirmation left by a save that reran the app
+if 'save_message' in st.session_state:
+    st.toast(st.session_state.pop('save_message'))
+
 # Enhanced Main Title with better visual hierarchy
 page_titles = {
     "Meetings Summary & Export": "📊 Smart Meeting Summary",
@@ -1853,7 +1773,9 @@ st.markdown(f"""
 # ============================================================================
 # PAGE 1: Add New Meeting
 # ============================================================================
-if st.session_state.current_page == "Add New Meeting":
+@st.fragment
+def add_meeting_form():
+    """Add New Meeting form - a submit that fails validation reruns only this fragment, not the whole page"""
     with st.form("add_meeting_form", clear_on_submit=True):
         # Basic Information
         st.markdown("### 📝 Basic Information")
@@ -1886,18 +1808,19 @@ if st.session_state.current_page == "Add New Meeting":
                 placeholder="Enter meeting purpose",
                 help="Enter the purpose of the meeting"
             )
-            meeting_type = st.selectbox("Meeting Type", ["In Person", "Virtual"], index=1)
-            priority = st.selectbox("Priority", ["Low", "Medium", "High", "Urgent"], index=1)
-            status = st.selectbox("Status", ["Upcoming", "Ongoing", "Ended", "Completed"], index=0)
+            meeting_type = st.selectbox("Meeting Type", MEETING_TYPE_OPTIONS, index=1)
+            priority = st.selectbox("Priority", PRIORITY_OPTIONS, index=1)
+            status = st.selectbox("Status", STATUS_OPTIONS, index=0)
         
-        # Date and Time
+        # Date and Time - one clock read per run; keyed widgets keep the entered values across reruns
         st.markdown("### 🕐 Date & Time")
         col_date1, col_date2, col_date3 = st.columns(3)
+        now = datetime.now().replace(second=0, microsecond=0)
         
         with col_date1:
-            meeting_date = st.date_input("Meeting Date *", value=datetime.now().date())
+            meeting_date = st.date_input("Meeting Date *", value=now.date(), key="add_meeting_date")
         with col_date2:
-            start_time = st.time_input("Start Time *", value=datetime.now().time())
+            start_time = st.time_input("Start Time *", value=now.time(), key="add_meeting_start_time")
         with col_date3:
             time_zone = st.text_input("Time Zone", value="UTC", placeholder="e.g., UTC, EST, PST")
         
@@ -1969,8 +1892,8 @@ if st.session_state.current_page == "Add New Meeting":
             )
             follow_up_date = st.date_input("Follow up Date", value=None)
         with col_follow2:
-            reminder_sent = st.selectbox("Reminder Sent", ["Yes", "No"], index=1)
-            calendar_sync = st.selectbox("Calendar Sync", ["Yes", "No"], index=1)
+            reminder_sent = st.selectbox("Reminder Sent", YES_NO_OPTIONS, index=1)
+            calendar_sync = st.selectbox("Calendar Sync", YES_NO_OPTIONS, index=1)
         
         calendar_event_title = st.text_input(
             "Calendar Event Title",
@@ -1982,67 +1905,60 @@ if st.session_state.current_page == "Add New Meeting":
         submitted = st.form_submit_button("💾 Save Meeting", type="primary", use_container_width=True)
         
         if submitted:
-            # Validation
-            errors = []
-            if not stakeholder_name.strip():
-                errors.append("Stakeholder Name is required")
-            
-            if not attendees.strip():
-                errors.append("Attendees is required")
+            new_row = {
+                'Meeting Title': '',
+                'Organization': organization,
+                'Client': client,
+                'Stakeholder Name': stakeholder_name,
+                'Purpose': purpose,
+                'Agenda': agenda,
+                'Meeting Date': pd.Timestamp(meeting_date) if meeting_date else pd.NaT,
+                'Start Time': start_time.strftime('%H:%M:%S') if start_time else '',
+                'Time Zone': time_zone,
+                'Meeting Type': meeting_type,
+                'Meeting Link': meeting_link,
+                'Website': website,
+                'Status': status,
+                'Priority': priority,
+                'Attendees': attendees,
+                'Internal External Guests': internal_external_guests,
+                'Notes': notes,
+                'Next Action': next_action,
+                'Follow up Date': pd.Timestamp(follow_up_date) if follow_up_date else pd.NaT,
+                'Reminder Sent': reminder_sent,
+                'Calendar Sync': calendar_sync,
+                'Calendar Event Title': calendar_event_title
+            }
+            # Strip each text value once, as the edit page does
+            new_row = {col: value.strip() if isinstance(value, str) else value for col, value in new_row.items()}
             
-            if not internal_external_guests.strip():
-                errors.append("Internal External Guests is required")
+            # Validation, on the stripped values
+            errors = [f"{field} is required" for field in ADD_FORM_REQUIRED_FIELDS if not new_row[field]]
             
             if errors:
                 for error in errors:
                     st.error(error)
             else:
-                # Create new meeting
-                new_meeting = pd.DataFrame([{
-                    'Meeting ID': get_next_meeting_id(st.session_state.meetings_df),
-                    'Meeting Title': '',
-                    'Organization': organization.strip(),
-                    'Client': client.strip(),
-                    'Stakeholder Name': stakeholder_name.strip(),
-                    'Purpose': purpose.strip(),
-                    'Agenda': agenda.strip(),
-                    'Meeting Date': meeting_date,
-                    'Start Time': start_time.strftime('%H:%M:%S') if start_time else '',
-                    'Time Zone': time_zone.strip(),
-                    'Meeting Type': meeting_type,
-                    'Meeting Link': meeting_link.strip(),
-                    'Website': website.strip(),
-                    'Status': status,
-                    'Priority': priority,
-                    'Attendees': attendees.strip(),
-                    'Internal External Guests': internal_external_guests.strip(),
-                    'Notes': notes.strip(),
-                    'Next Action': next_action.strip(),
-                    'Follow up Date': follow_up_date if follow_up_date else pd.NaT,
-                    'Reminder Sent': reminder_sent,
-                    'Calendar Sync': calendar_sync,
-                    'Calendar Event Title': calendar_event_title.strip()
-                }])
+                # Create new meeting; the ID is only allocated once the row is valid
+                new_row = {'Meeting ID': allocate_meeting_id(), **new_row}
                 
                 # Calculate status if not manually set
                 if status == "Upcoming":
-                    new_meeting['Status'] = new_meeting.apply(calculate_status, axis=1)
+                    new_row['Status'] = status_from_datetime(meeting_date, start_time)
                 
-                # Append to existing dataframe
-                if st.session_state.meetings_df.empty:
-                    st.session_state.meetings_df = new_meeting
-                else:
-                    st.session_state.meetings_df = pd.concat([st.session_state.meetings_df, new_meeting], ignore_index=True)
+                # Buffer the row; it is concatenated into meetings_df on the next read
+                st.session_state.pending_inserts.append(new_row)
                 
-                # Save to Excel
-                if save_meetings(st.session_state.meetings_df):
-                    st.success("✅ Meeting saved successfully!")
-                    st.balloons()
-                    time.sleep(1)
+                # Save only the new meeting
+                if append_meeting([new_row]):
+                    st.session_state.save_message = "✅ Meeting saved successfully!"
                     st.rerun()
                 else:
                     st.error("Failed to save meeting")
 
+if st.session_state.current_page == "Add New Meeting":
+    add_meeting_form()
+
 # ============================================================================
 # PAGE 2: Edit/Update Meeting
 # ============================================================================
@@ -2050,25 +1966,16 @@ elif st.session_state.current_page == "Edit/Update Meeting":
     st.markdown("### ✏️ Edit/Update an Existing Meeting")
     st.markdown("Select a meeting from the list below to edit or update it.")
     
-    if not st.session_state.meetings_df.empty:
-        # Create selection list with index tracking for reliable lookup
-        meeting_options = {}
-        meeting_index_map = {}  # Map label to DataFrame index
-        for idx, row in st.session_state.meetings_df.iterrows():
-            org = str(row.get('Organization', 'N/A'))
-            stakeholder = str(row.get('Stakeholder Name', 'N/A'))
-            meeting_date = row.get('Meeting Date', '')
-            if pd.notna(meeting_date):
-                try:
-                    date_str = pd.to_datetime(meeting_date).strftime('%Y-%m-%d')
-                except:
-                    date_str = str(meeting_date)
-            else:
-                date_str = 'N/A'
-            label = f"{org} - {stakeholder} - {date_str}"
-            meeting_id = row.get('Meeting ID', idx)
-            meeting_options[label] = meeting_id
-            meeting_index_map[label] = idx  # Store the actual DataFrame index
+    if not get_meetings_df().empty:
+        # Offer the most recent meetings, narrowed by an optional search
+        edit_search = st.text_input("Search meetings", value="", placeholder="Search by organization, stakeholder, title or attendees")
+        # Labels are rebuilt only when the data or the search changes, not on every widget interaction
+        meeting_options, meeting_index_map, match_count = get_edit_select_options(edit_search.strip())
+        if match_count == 0:
+            st.info("No meetings match your search.")
+            st.stop()
+        if match_count > EDIT_SELECT_LIMIT:
+            st.caption(f"Showing the {EDIT_SELECT_LIMIT} most recent of {match_count} meetings. Search to find older ones.")
         
         selected_meeting_label = st.selectbox("Select Meeting to Edit/Delete", list(meeting_options.keys()))
         selected_meeting_id = meeting_options[selected_meeting_label]
@@ -2083,19 +1990,15 @@ elif st.session_state.current_page == "Edit/Update Meeting":
             try:
                 selected_meeting = st.session_state.meetings_df.loc[df_index]
             except (KeyError, IndexError):
-                # Fallback: try filtering by Meeting ID
+                # Fallback: look up by Meeting ID
                 if 'Meeting ID' in st.session_state.meetings_df.columns:
                     try:
-                        # Try exact match first
-                        mask = st.session_state.meetings_df['Meeting ID'] == selected_meeting_id
-                        if not mask.any():
-                            # Try string conversion for type mismatch
-                            mask = st.session_state.meetings_df['Meeting ID'].astype(str) == str(selected_meeting_id)
-                        if mask.any():
-                            filtered_df = st.session_state.meetings_df[mask]
-                            selected_meeting = filtered_df.iloc[0]
-                            # Get the actual index from the filtered result
-                            selected_df_index = filtered_df.index[0]
+                        # Exact match first, then the string form for type mismatch
+                        index_by_id = get_meeting_index_by_id()
+                        found_idx = index_by_id.get(selected_meeting_id, index_by_id.get(str(selected_meeting_id)))
+                        if found_idx is not None:
+                            selected_meeting = st.session_state.meetings_df.loc[found_idx]
+                            selected_df_index = found_idx
                     except Exception as e:
                         st.error(f"❌ Error finding meeting: {str(e)}")
                         st.stop()
@@ -2113,10 +2016,16 @@ elif st.session_state.current_page == "Edit/Update Meeting":
             st.error("❌ Selected meeting data is empty. Please refresh the page.")
             st.stop()
         
+        # Read the fields below from a plain dict instead of Series label lookups
+        selected_meeting = selected_meeting.to_dict()
+        
         # Store the index in session state for use in update/delete operations
         if selected_df_index is not None:
             st.session_state.selected_meeting_index = selected_df_index
         
+        # Parsed once per meeting and data version, not on every widget interaction
+        edit_defaults = get_edit_form_defaults(selected_df_index, selected_meeting)
+        
         # Display current meeting info
         with st.expander("📋 View Current Meeting Details", expanded=False):
             col1, col2 = st.columns(2)
@@ -2128,15 +2037,8 @@ elif st.session_state.current_page == "Edit/Update Meeting":
                 if selected_meeting.get('Stakeholder Name'):
                     st.write(f"**Stakeholder:** {selected_meeting.get('Stakeholder Name', 'N/A')}")
             with col2:
-                meeting_date = selected_meeting.get('Meeting Date', '')
-                if pd.notna(meeting_date):
-                    try:
-                        date_str = pd.to_datetime(meeting_date).strftime('%Y-%m-%d')
-                    except:
-                        date_str = str(meeting_date)
-                else:
-                    date_str = 'N/A'
-                st.write(f"**Meeting Date:** {date_str}")
+                meeting_date = edit_defaults['Meeting Date']
+                st.write(f"**Meeting Date:** {meeting_date.strftime('%Y-%m-%d') if meeting_date else 'N/A'}")
                 st.write(f"**Start Time:** {selected_meeting.get('Start Time', 'N/A')}")
                 st.write(f"**Time Zone:** {selected_meeting.get('Time Zone', 'N/A')}")
                 if selected_meeting.get('Meeting Link'):
@@ -2156,17 +2058,17 @@ elif st.session_state.current_page == "Edit/Update Meeting":
             with col1:
                 edit_organization = st.text_input(
                     "Organization",
-                    value=str(selected_meeting.get('Organization', '')),
+                    value=edit_defaults['Organization'],
                     placeholder="Enter organization name"
                 )
                 edit_client = st.text_input(
                     "Client",
-                    value=str(selected_meeting.get('Client', '')),
+                    value=edit_defaults['Client'],
                     placeholder="Enter client name"
                 )
                 edit_stakeholder_name = st.text_input(
                     "Stakeholder Name *",
-                    value=str(selected_meeting.get('Stakeholder Name', '')),
+                    value=edit_defaults['Stakeholder Name'],
                     placeholder="Enter stakeholder name(s)",
                     help="Enter the name(s) of key stakeholders (Required)"
                 )
@@ -2174,97 +2076,75 @@ elif st.session_state.current_page == "Edit/Update Meeting":
             with col2:
                 edit_purpose = st.text_input(
                     "Purpose",
-                    value=str(selected_meeting.get('Purpose', '')),
+                    value=edit_defaults['Purpose'],
                     placeholder="Enter meeting purpose"
                 )
-                current_meeting_type = str(selected_meeting.get('Meeting Type', 'Virtual'))
-                edit_meeting_type = st.selectbox("Meeting Type", ["In Person", "Virtual"], 
+                current_meeting_type = edit_defaults['Meeting Type']
+                edit_meeting_type = st.selectbox("Meeting Type", MEETING_TYPE_OPTIONS, 
                                                index=0 if current_meeting_type == "In Person" else 1)
-                current_priority = str(selected_meeting.get('Priority', 'Medium'))
-                edit_priority = st.selectbox("Priority", ["Low", "Medium", "High", "Urgent"], 
-                                            index=["Low", "Medium", "High", "Urgent"].index(current_priority) if current_priority in ["Low", "Medium", "High", "Urgent"] else 1)
-                current_status = str(selected_meeting.get('Status', 'Upcoming'))
-                edit_status = st.selectbox("Status", ["Upcoming", "Ongoing", "Ended", "Completed"], 
-                                         index=["Upcoming", "Ongoing", "Ended", "Completed"].index(current_status) if current_status in ["Upcoming", "Ongoing", "Ended", "Completed"] else 0)
+                current_priority = edit_defaults['Priority']
+                edit_priority = st.selectbox("Priority", PRIORITY_OPTIONS, 
+                                            index=PRIORITY_INDEX.get(current_priority, 1))
+                current_status = edit_defaults['Status']
+                edit_status = st.selectbox("Status", STATUS_OPTIONS, 
+                                         index=STATUS_INDEX.get(current_status, 0))
             
             # Date and Time
             st.markdown("### 🕐 Date & Time")
             col_date1, col_date2, col_date3 = st.columns(3)
             
             with col_date1:
-                meeting_date_val = selected_meeting.get('Meeting Date', datetime.now().date())
-                if pd.notna(meeting_date_val):
-                    try:
-                        edit_meeting_date = st.date_input("Meeting Date *", value=pd.to_datetime(meeting_date_val).date())
-                    except:
-                        edit_meeting_date = st.date_input("Meeting Date *", value=datetime.now().date())
-                else:
-                    edit_meeting_date = st.date_input("Meeting Date *", value=datetime.now().date())
+                edit_meeting_date = st.date_input("Meeting Date *", value=edit_defaults['Meeting Date'] or datetime.now().date())
             
             with col_date2:
-                start_time_str = str(selected_meeting.get('Start Time', ''))
-                try:
-                    if ':' in start_time_str:
-                        time_parts = start_time_str.split(':')
-                        edit_start_time = st.time_input("Start Time *", value=datetime.strptime(start_time_str[:5], '%H:%M').time() if len(time_parts) >= 2 else datetime.now().time())
-                    else:
-                        edit_start_time = st.time_input("Start Time *", value=datetime.now().time())
-                except:
-                    edit_start_time = st.time_input("Start Time *", value=datetime.now().time())
+                edit_start_time = st.time_input("Start Time *", value=edit_defaults['Start Time'] or datetime.now().time())
             
             with col_date3:
-                edit_time_zone = st.text_input("Time Zone", value=str(selected_meeting.get('Time Zone', 'UTC')))
+                edit_time_zone = st.text_input("Time Zone", value=edit_defaults['Time Zone'])
             
             # Website and Links
             st.markdown("### 📍 Website & Links")
             col_loc1, col_loc2 = st.columns(2)
             
             with col_loc1:
-                edit_meeting_link = st.text_input("Meeting Link", value=str(selected_meeting.get('Meeting Link', '')))
+                edit_meeting_link = st.text_input("Meeting Link", value=edit_defaults['Meeting Link'])
             with col_loc2:
-                edit_website = st.text_input("Website", value=str(selected_meeting.get('Website', '')), placeholder="Enter website URL")
+                edit_website = st.text_input("Website", value=edit_defaults['Website'], placeholder="Enter website URL")
             
             # Attendees
             st.markdown("### 👥 Attendees")
             col_att1, col_att2 = st.columns(2)
             
             with col_att1:
-                edit_attendees = st.text_input("Attendees *", value=str(selected_meeting.get('Attendees', '')),
+                edit_attendees = st.text_input("Attendees *", value=edit_defaults['Attendees'],
                                               help="Enter names of all attendees (Required)")
             with col_att2:
                 edit_internal_external_guests = st.text_input("Internal External Guests *", 
-                                                             value=str(selected_meeting.get('Internal External Guests', '')),
+                                                             value=edit_defaults['Internal External Guests'],
                                                              help="Enter names of internal and external guests (Required)")
             
             # Agenda and Notes
             st.markdown("### 📋 Agenda & Notes")
-            edit_agenda = st.text_area("Agenda", value=str(selected_meeting.get('Agenda', '')), height=80)
-            edit_notes = st.text_area("Notes", value=str(selected_meeting.get('Notes', '')), height=80)
+            edit_agenda = st.text_area("Agenda", value=edit_defaults['Agenda'], height=80)
+            edit_notes = st.text_area("Notes", value=edit_defaults['Notes'], height=80)
             
             # Follow-up and Actions
             st.markdown("### ✅ Follow-up & Actions")
             col_follow1, col_follow2 = st.columns(2)
             
             with col_follow1:
-                edit_next_action = st.text_input("Next Action", value=str(selected_meeting.get('Next Action', '')))
-                follow_up_date_val = selected_meeting.get('Follow up Date', None)
-                if pd.notna(follow_up_date_val) and follow_up_date_val != '':
-                    try:
-                        edit_follow_up_date = st.date_input("Follow up Date", value=pd.to_datetime(follow_up_date_val).date())
-                    except:
-                        edit_follow_up_date = st.date_input("Follow up Date", value=None)
-                else:
-                    edit_follow_up_date = st.date_input("Follow up Date", value=None)
+                edit_next_action = st.text_input("Next Action", value=edit_defaults['Next Action'])
+                edit_follow_up_date = st.date_input("Follow up Date", value=edit_defaults['Follow up Date'])
             with col_follow2:
-                current_reminder = str(selected_meeting.get('Reminder Sent', 'No'))
-                edit_reminder_sent = st.selectbox("Reminder Sent", ["Yes", "No"], 
+                current_reminder = edit_defaults['Reminder Sent']
+                edit_reminder_sent = st.selectbox("Reminder Sent", YES_NO_OPTIONS, 
                                                  index=0 if current_reminder == "Yes" else 1)
-                current_cal_sync = str(selected_meeting.get('Calendar Sync', 'No'))
-                edit_calendar_sync = st.selectbox("Calendar Sync", ["Yes", "No"], 
+                current_cal_sync = edit_defaults['Calendar Sync']
+                edit_calendar_sync = st.selectbox("Calendar Sync", YES_NO_OPTIONS, 
                                                  index=0 if current_cal_sync == "Yes" else 1)
             
             edit_calendar_event_title = st.text_input("Calendar Event Title", 
-                                                      value=str(selected_meeting.get('Calendar Event Title', '')))
+                                                      value=edit_defaults['Calendar Event Title'])
             
             update_submitted = st.form_submit_button("💾 Update Meeting", type="primary", use_container_width=True)
             
@@ -2282,17 +2162,9 @@ elif st.session_state.current_page == "Edit/Update Meeting":
                     
                     # If stored index not available, try to find by Meeting ID
                     if idx is None and 'Meeting ID' in st.session_state.meetings_df.columns:
-                        try:
-                            # Try exact match first
-                            mask = st.session_state.meetings_df['Meeting ID'] == selected_meeting_id
-                            if not mask.any():
-                                # Try string conversion for type mismatch
-                                mask = st.session_state.meetings_df['Meeting ID'].astype(str) == str(selected_meeting_id)
-                            
-                            if mask.any():
-                                idx = st.session_state.meetings_df[mask].index[0]
-                        except (IndexError, KeyError):
-                            pass
+                        # Exact match first, then the string form for type mismatch
+                        index_by_id = get_meeting_index_by_id()
+                        idx = index_by_id.get(selected_meeting_id, index_by_id.get(str(selected_meeting_id)))
                     
                     # If still not found, try using the meeting_index_map
                     if idx is None and selected_meeting_label in meeting_index_map:
@@ -2309,37 +2181,48 @@ elif st.session_state.current_page == "Edit/Update Meeting":
                         st.stop()
                     
                     # Update meeting - automatically set missing required fields to empty string (null)
-                    st.session_state.meetings_df.at[idx, 'Organization'] = edit_organization.strip() if edit_organization else ''
-                    st.session_state.meetings_df.at[idx, 'Client'] = edit_client.strip() if edit_client else ''
-                    st.session_state.meetings_df.at[idx, 'Stakeholder Name'] = edit_stakeholder_name.strip() if edit_stakeholder_name.strip() else ''
-                    st.session_state.meetings_df.at[idx, 'Purpose'] = edit_purpose.strip() if edit_purpose else ''
-                    st.session_state.meetings_df.at[idx, 'Agenda'] = edit_agenda.strip() if edit_agenda else ''
-                    st.session_state.meetings_df.at[idx, 'Meeting Date'] = edit_meeting_date if edit_meeting_date else pd.NaT
-                    st.session_state.meetings_df.at[idx, 'Start Time'] = edit_start_time.strftime('%H:%M:%S') if edit_start_time else ''
-                    st.session_state.meetings_df.at[idx, 'Time Zone'] = edit_time_zone.strip() if edit_time_zone else ''
-                    st.session_state.meetings_df.at[idx, 'Meeting Type'] = edit_meeting_type if edit_meeting_type else ''
-                    st.session_state.meetings_df.at[idx, 'Meeting Link'] = edit_meeting_link.strip() if edit_meeting_link else ''
-                    st.session_state.meetings_df.at[idx, 'Website'] = edit_website.strip() if edit_website else ''
-                    st.session_state.meetings_df.at[idx, 'Status'] = edit_status if edit_status else ''
-                    st.session_state.meetings_df.at[idx, 'Priority'] = edit_priority if edit_priority else ''
-                    st.session_state.meetings_df.at[idx, 'Attendees'] = edit_attendees.strip() if edit_attendees.strip() else ''
-                    st.session_state.meetings_df.at[idx, 'Internal External Guests'] = edit_internal_external_guests.strip() if edit_internal_external_guests.strip() else ''
-                    st.session_state.meetings_df.at[idx, 'Notes'] = edit_notes.strip() if edit_notes else ''
-                    st.session_state.meetings_df.at[idx, 'Next Action'] = edit_next_action.strip() if edit_next_action else ''
-                    st.session_state.meetings_df.at[idx, 'Follow up Date'] = edit_follow_up_date if edit_follow_up_date else pd.NaT
-                    st.session_state.meetings_df.at[idx, 'Reminder Sent'] = edit_reminder_sent if edit_reminder_sent else ''
-                    st.session_state.meetings_df.at[idx, 'Calendar Sync'] = edit_calendar_sync if edit_calendar_sync else ''
-                    st.session_state.meetings_df.at[idx, 'Calendar Event Title'] = edit_calendar_event_title.strip() if edit_calendar_event_title else ''
+                    updates = {
+                        'Organization': edit_organization,
+                        'Client': edit_client,
+                        'Stakeholder Name': edit_stakeholder_name,
+                        'Purpose': edit_purpose,
+                        'Agenda': edit_agenda,
+                        'Meeting Date': pd.Timestamp(edit_meeting_date) if edit_meeting_date else pd.NaT,
+                        'Start Time': edit_start_time.strftime('%H:%M:%S') if edit_start_time else '',
+                        'Time Zone': edit_time_zone,
+                        'Meeting Type': edit_meeting_type,
+                        'Meeting Link': edit_meeting_link,
+                        'Website': edit_website,
+                        'Status': edit_status,
+                        'Priority': edit_priority,
+                        'Attendees': edit_attendees,
+                        'Internal External Guests': edit_internal_external_guests,
+                        'Notes': edit_notes,
+                        'Next Action': edit_next_action,
+                        'Follow up Date': pd.Timestamp(edit_follow_up_date) if edit_follow_up_date else pd.NaT,
+                        'Reminder Sent': edit_reminder_sent,
+                        'Calendar Sync': edit_calendar_sync,
+                        'Calendar Event Title': edit_calendar_event_title,
+                    }
+                    # Strip each text value once; empty fields are stored as empty strings (null)
+                    updates = {col: value.strip() if isinstance(value, str) else value for col, value in updates.items()}
+                    # The time widget has minute resolution; keep the stored text if the minute is unchanged
+                    stored_time = edit_defaults['Start Time']
+                    if stored_time and edit_start_time == stored_time.replace(second=0, microsecond=0):
+                        updates['Start Time'] = selected_meeting.get('Start Time')
+                    if not meeting_values_changed(st.session_state.meetings_df, idx, updates):
+                        st.info("No changes to save")
+                        st.stop()
+                    set_meeting_values(st.session_state.meetings_df, idx, updates)
                     
-                    # Save to Excel
-                    if save_meetings(st.session_state.meetings_df):
+                    # Save the edited row
+                    if update_meeting(st.session_state.meetings_df, idx):
                         # Store the manually set status to preserve it after reload
                         if 'manually_set_statuses' not in st.session_state:
                             st.session_state.manually_set_statuses = {}
                         st.session_state.manually_set_statuses[selected_meeting_id] = edit_status
                         
-                        st.success("Meeting Updated Successfully")
-                        time.sleep(1.5)
+                        st.session_state.save_message = "Meeting Updated Successfully"
                         st.rerun()
                     else:
                         st.error("Failed to update meeting")
@@ -2368,8 +2251,7 @@ elif st.session_state.current_page == "Meetings Summary & Export":
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        status_options = ["All", "Upcoming", "Ongoing", "Ended", "Completed"]
-        selected_status = st.selectbox("Filter by Status", status_options)
+        selected_status = st.selectbox("Filter by Status", STATUS_FILTER_OPTIONS)
     
     with col2:
         date_start = st.date_input("Start Date", value=None)
@@ -2382,14 +2264,8 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                                   help="Search by title, organizer, stakeholder, or attendee names")
     
     # Apply filters
-    if not st.session_state.meetings_df.empty:
-        filtered_meetings = filter_meetings(
-            st.session_state.meetings_df,
-            selected_status,
-            date_start,
-            date_end,
-            search_text
-        )
+    if not get_meetings_df().empty:
+        filtered_meetings = get_filtered_meetings(selected_status, date_start, date_end, search_text)
     else:
         filtered_meetings = pd.DataFrame()
     
@@ -2411,51 +2287,9 @@ elif st.session_state.current_page == "Meetings Summary & Export":
     with col_template1:
         st.write("Upload an Excel file to import or update meeting records. Download the template below to ensure correct format.")
     with col_template2:
-        # Create template dataframe with all template columns
-        template_columns = [
-            'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-            'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-            'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-            'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-            'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-        ]
-        template_df = pd.DataFrame(columns=template_columns)
-        # Add sample row
-        template_df = pd.concat([template_df, pd.DataFrame([{
-            'Meeting ID': 1,
-            'Meeting Title': 'Sample Meeting',
-            'Organization': 'Sample Org',
-            'Client': 'Sample Client',
-            'Stakeholder Name': 'Jane Smith',
-            'Purpose': 'Sample Purpose',
-            'Agenda': 'Sample agenda items',
-            'Meeting Date': datetime.now().date(),
-            'Start Time': datetime.now().time().strftime('%H:%M:%S'),
-            'Time Zone': 'UTC',
-            'Meeting Type': 'Virtual',
-            'Meeting Link': 'https://meet.example.com',
-            'Website': '',
-            'Status': 'Upcoming',
-            'Priority': 'Medium',
-            'Attendees': 'Team Member 1, Team Member 2',
-            'Internal External Guests': 'Client A, Client B',
-            'Notes': 'Sample notes',
-            'Next Action': 'Follow up required',
-            'Follow up Date': '',
-            'Reminder Sent': 'No',
-            'Calendar Sync': 'No',
-            'Calendar Event Title': 'Sample Meeting'
-        }])], ignore_index=True)
-        
-        # Save template to bytes
-        import io
-        template_buffer = io.BytesIO()
-        template_df.to_excel(template_buffer, index=False)
-        template_buffer.seek(0)
-        
         st.download_button(
             label="📥 Download Template",
-            data=template_buffer,
+            data=build_meeting_template_bytes(datetime.now().date()),
             file_name="meeting_import_template.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             help="Download a template Excel file with the correct column format",
@@ -2470,13 +2304,14 @@ elif st.session_state.current_page == "Meetings Summary & Export":
     
     if uploaded_file is not None:
         try:
+            uploaded_bytes = uploaded_file.getvalue()
             # Read the uploaded file - try with header=0 first
-            import_df = pd.read_excel(uploaded_file, header=0)
+            import_df = read_uploaded_excel(uploaded_bytes, 0)
             
             # If we got "Unnamed" columns, try to find the header row
             if any('Unnamed' in str(col) for col in import_df.columns) or (len(import_df.columns) > 0 and str(import_df.columns[0]).startswith('Unnamed')):
                 # Try reading without header first to see the data
-                temp_df = pd.read_excel(uploaded_file, header=None)
+                temp_df = read_uploaded_excel(uploaded_bytes, None)
                 # Look for a row that contains "Organization" or "Meeting Title" (case-insensitive)
                 header_row = None
                 for idx in range(min(5, len(temp_df))):  # Check first 5 rows
@@ -2487,13 +2322,13 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                 
                 if header_row is not None:
                     # Re-read with the correct header row
-                    import_df = pd.read_excel(uploaded_file, header=header_row)
+                    import_df = read_uploaded_excel(uploaded_bytes, header_row)
                 else:
                     # If no header row found, use first row as header
-                    import_df = pd.read_excel(uploaded_file, header=0)
+                    import_df = read_uploaded_excel(uploaded_bytes, 0)
                     # If still unnamed, try header=None and use first row
                     if any('Unnamed' in str(col) for col in import_df.columns):
-                        temp_df = pd.read_excel(uploaded_file, header=None)
+                        temp_df = read_uploaded_excel(uploaded_bytes, None)
                         if len(temp_df) > 0:
                             # Use first row as column names
                             import_df.columns = [str(val).strip() if pd.notna(val) else f'Unnamed_{i}' for i, val in enumerate(temp_df.iloc[0].values)]
@@ -2525,11 +2360,7 @@ elif st.session_state.current_page == "Meetings Summary & Export":
             else:
                 # Rename columns to standard format (case-insensitive)
                 rename_dict = {}
-                for std_col in ['Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                               'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                               'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                               'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                               'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title']:
+                for std_col in TEMPLATE_COLUMNS:
                     std_col_lower = std_col.lower()
                     if std_col_lower in column_mapping:
                         original_col = column_mapping[std_col_lower]
@@ -2541,19 +2372,10 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                 
                 if rename_dict:
                     import_df = import_df.rename(columns=rename_dict)
-                # Add missing columns with empty values
-                template_columns = [
-                    'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                    'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                    'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                    'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                    'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-                ]
-                
-                missing_columns = [col for col in template_columns if col not in import_df.columns]
+                # Add missing columns with empty values, all in one assign
+                missing_columns = [col for col in TEMPLATE_COLUMNS if col not in import_df.columns]
                 if missing_columns:
-                    for col in missing_columns:
-                        import_df[col] = ''
+                    import_df = import_df.assign(**dict.fromkeys(missing_columns, ''))
                 
                 # Ensure datetime columns are properly formatted
                 if 'Meeting Date' in import_df.columns:
@@ -2570,76 +2392,20 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                 import_mode = "Update & Add New"
                 overwrite_status = False
                 
-                # Normalize empty values to null
-                for idx, row in import_df.iterrows():
-                    organization = row.get('Organization', '')
-                    has_organization = (
-                        pd.notna(organization) and 
-                        str(organization).strip() != '' and 
-                        str(organization).strip().lower() not in ['nan', 'none', 'null', '']
-                    )
-                    
-                    if has_organization:
-                        meeting_date = row.get('Meeting Date', '')
-                        is_date_empty = True
-                        if pd.notna(meeting_date):
-                            if isinstance(meeting_date, (pd.Timestamp, datetime)):
-                                if isinstance(meeting_date, pd.Timestamp) and pd.isna(meeting_date):
-                                    is_date_empty = True
-                                else:
-                                    is_date_empty = False
-                            elif isinstance(meeting_date, str):
-                                date_str = meeting_date.strip()
-                                if date_str and date_str.lower() not in ['nan', 'none', 'null', '', 'nat']:
-                                    try:
-                                        parsed_date = pd.to_datetime(date_str)
-                                        if pd.notna(parsed_date):
-                                            is_date_empty = False
-                                    except:
-                                        pass
-                            else:
-                                date_str = str(meeting_date).strip()
-                                if date_str and date_str.lower() not in ['nan', 'none', 'null', '', 'nat']:
-                                    try:
-                                        parsed_date = pd.to_datetime(date_str)
-                                        if pd.notna(parsed_date):
-                                            is_date_empty = False
-                                    except:
-                                        pass
-                        
-                        if is_date_empty:
-                            import_df.at[idx, 'Meeting Date'] = pd.NaT
-                        
-                        start_time = row.get('Start Time', '')
-                        is_time_empty = True
-                        if pd.notna(start_time):
-                            time_str = str(start_time).strip()
-                            if time_str and time_str.lower() not in ['nan', 'none', 'null', '']:
-                                is_time_empty = False
-                        
-                        if is_time_empty:
-                            import_df.at[idx, 'Start Time'] = ''
+                # Normalize empty values to null, column-wise for rows that have an organization
+                null_tokens = ['nan', 'none', 'null', '']
+                has_organization = ~import_df['Organization'].fillna('').astype(str).str.strip().str.lower().isin(null_tokens)
+                # Meeting Date was already coerced above, so unparseable or blank dates are NaT
+                time_text = import_df['Start Time'].fillna('').astype(str).str.strip().str.lower()
+                empty_time = has_organization & time_text.isin(null_tokens)
+                if empty_time.any():
+                    import_df['Start Time'] = import_df['Start Time'].astype(object).where(~empty_time, '')
                 
                 # Proceed with import
                 if st.button("✅ Import Data", type="primary", use_container_width=True, key="import_btn_top"):
                     try:
-                        # Ensure all template columns exist
-                        template_columns = [
-                            'Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name',
-                            'Purpose', 'Agenda', 'Meeting Date', 'Start Time', 'Time Zone',
-                            'Meeting Type', 'Meeting Link', 'Website', 'Status', 'Priority',
-                            'Attendees', 'Internal External Guests', 'Notes', 'Next Action',
-                            'Follow up Date', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title'
-                        ]
-                        for col in template_columns:
-                            if col not in import_df.columns:
-                                import_df[col] = ''
-                        
                         # Fill NaN values with empty strings for text columns
-                        text_columns = ['Meeting ID', 'Meeting Title', 'Organization', 'Client', 'Stakeholder Name', 'Purpose', 
-                                      'Agenda', 'Start Time', 'Time Zone', 'Meeting Type', 'Meeting Link', 
-                                      'Website', 'Status', 'Priority', 'Attendees', 'Internal External Guests', 'Notes', 
-                                      'Next Action', 'Reminder Sent', 'Calendar Sync', 'Calendar Event Title']
+                        text_columns = [col for col in TEMPLATE_COLUMNS if col not in ('Meeting Date', 'Follow up Date')]
                         for col in text_columns:
                             if col in import_df.columns:
                                 import_df[col] = import_df[col].fillna('').astype(str)
@@ -2649,22 +2415,22 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                             import_df['Status'] = ''
                         
                         # Calculate status only for rows with Meeting Date and Start Time
-                        for idx, row in import_df.iterrows():
-                            if pd.isna(row.get('Status')) or str(row.get('Status', '')).strip() == '':
-                                has_date = pd.notna(row.get('Meeting Date')) and str(row.get('Meeting Date', '')).strip() != ''
-                                has_time = pd.notna(row.get('Start Time')) and str(row.get('Start Time', '')).strip() != ''
-                                if has_date and has_time:
-                                    import_df.at[idx, 'Status'] = calculate_status(row)
-                                else:
-                                    import_df.at[idx, 'Status'] = ''
+                        blank_status = import_df['Status'].isna() | import_df['Status'].astype(str).str.strip().eq('')
+                        has_date = import_df['Meeting Date'].notna()
+                        has_time = import_df['Start Time'].notna() & import_df['Start Time'].astype(str).str.strip().ne('')
+                        if blank_status.any():
+                            statuses = import_df['Status'].astype(object).where(~blank_status, '')
+                            to_calculate = blank_status & has_date & has_time
+                            if to_calculate.any():
+                                statuses[to_calculate] = compute_statuses(import_df.loc[to_calculate])
+                            import_df['Status'] = statuses
                         
                         # Get current dataframe
                         current_df = st.session_state.meetings_df.copy()
                         
-                        # Clean up Meeting ID column
+                        # Clean up Meeting ID column: blanks and non-numeric IDs become missing
                         if 'Meeting ID' in import_df.columns:
-                            import_df['Meeting ID'] = import_df['Meeting ID'].replace('', pd.NA)
-                            import_df['Meeting ID'] = import_df['Meeting ID'].replace(' ', pd.NA)
+                            import_df['Meeting ID'] = pd.to_numeric(import_df['Meeting ID'], errors='coerce')
                         
                         if current_df.empty:
                             if 'Meeting ID' not in import_df.columns or import_df['Meeting ID'].isna().all():
@@ -2672,73 +2438,66 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                             else:
                                 missing_mask = import_df['Meeting ID'].isna()
                                 if missing_mask.any():
-                                    max_id = pd.to_numeric(import_df['Meeting ID'], errors='coerce').max()
+                                    max_id = import_df['Meeting ID'].max()
                                     if pd.isna(max_id):
                                         max_id = 0
                                     next_id = int(max_id) + 1
                                     import_df.loc[missing_mask, 'Meeting ID'] = range(next_id, next_id + missing_mask.sum())
-                            st.session_state.meetings_df = import_df.copy()
+                            st.session_state.meetings_df = coerce_meeting_ids(import_df)
                             added_count = len(import_df)
                             updated_count = 0
                         else:
+                            # Session IDs are already Int64 (coerce_meeting_ids at load)
+                            has_current_ids = 'Meeting ID' in current_df.columns
+                            max_current = current_df['Meeting ID'].max() if has_current_ids else 0
+                            if pd.isna(max_current):
+                                max_current = 0
+                            
                             if 'Meeting ID' not in import_df.columns or import_df['Meeting ID'].isna().all():
-                                if 'Meeting ID' in current_df.columns:
-                                    max_id = pd.to_numeric(current_df['Meeting ID'], errors='coerce').max()
-                                    if pd.isna(max_id):
-                                        max_id = 0
-                                else:
-                                    max_id = 0
-                                import_df['Meeting ID'] = range(int(max_id) + 1, int(max_id) + 1 + len(import_df))
+                                import_df['Meeting ID'] = range(int(max_current) + 1, int(max_current) + 1 + len(import_df))
                             else:
                                 missing_mask = import_df['Meeting ID'].isna()
                                 if missing_mask.any():
-                                    max_current = pd.to_numeric(current_df['Meeting ID'], errors='coerce').max() if 'Meeting ID' in current_df.columns else 0
-                                    max_import = pd.to_numeric(import_df['Meeting ID'], errors='coerce').max()
-                                    max_id = max(max_current if not pd.isna(max_current) else 0, max_import if not pd.isna(max_import) else 0)
+                                    max_import = import_df['Meeting ID'].max()
+                                    max_id = max(max_current, max_import if not pd.isna(max_import) else 0)
                                     next_id = int(max_id) + 1
                                     import_df.loc[missing_mask, 'Meeting ID'] = range(next_id, next_id + missing_mask.sum())
                             
-                            import_df['Meeting ID'] = pd.to_numeric(import_df['Meeting ID'], errors='coerce')
-                            if 'Meeting ID' in current_df.columns:
-                                current_df['Meeting ID'] = pd.to_numeric(current_df['Meeting ID'], errors='coerce')
-                            
                             added_count = 0
                             updated_count = 0
                             
-                            if 'Meeting ID' in current_df.columns and 'Meeting ID' in import_df.columns:
-                                existing_ids = set(pd.to_numeric(current_df['Meeting ID'], errors='coerce').dropna().astype(int))
-                                import_df_ids = pd.to_numeric(import_df['Meeting ID'], errors='coerce')
-                                mask_update = import_df_ids.isin(existing_ids) & import_df_ids.notna()
+                            if has_current_ids:
+                                existing_ids = current_df['Meeting ID'].dropna().unique()
+                                mask_update = import_df['Meeting ID'].isin(existing_ids) & import_df['Meeting ID'].notna()
                                 mask_add = ~mask_update
-                                to_update = import_df[mask_update].copy()
-                                to_add = import_df[mask_add].copy()
+                                to_update = import_df[mask_update]
+                                to_add = import_df[mask_add]
                             else:
                                 to_update = pd.DataFrame()
-                                to_add = import_df.copy()
+                                to_add = import_df
                             
-                            # Update existing
+                            # Update existing, aligned on Meeting ID instead of scanning per row
                             if not to_update.empty:
-                                for _, row in to_update.iterrows():
-                                    meeting_id = pd.to_numeric(row.get('Meeting ID'), errors='coerce')
-                                    if pd.notna(meeting_id) and 'Meeting ID' in current_df.columns:
-                                        idx = current_df[pd.to_numeric(current_df['Meeting ID'], errors='coerce') == meeting_id].index[0]
-                                        for col in current_df.columns:
-                                            if col in row and col != 'Status':
-                                                current_df.at[idx, col] = row[col]
-                                            elif col == 'Status':
-                                                if overwrite_status:
-                                                    current_df.at[idx, col] = row.get('Status', calculate_status(row))
-                                        if overwrite_status or pd.isna(row.get('Status')):
-                                            current_df.at[idx, 'Status'] = calculate_status(current_df.iloc[idx])
+                                # Later rows for the same ID win, as they did when applied one by one
+                                latest = to_update.drop_duplicates(subset='Meeting ID', keep='last')
+                                current_ids = current_df['Meeting ID']
+                                first_rows = ~current_ids.duplicated()
+                                index_by_id = pd.Series(current_df.index[first_rows], index=current_ids[first_rows].to_numpy())
+                                target_idx = index_by_id.loc[latest['Meeting ID'].to_numpy()].to_numpy()
+                                columns = [col for col in current_df.columns if col in latest.columns and (col != 'Status' or overwrite_status)]
+                                set_meeting_rows(current_df, target_idx, latest[columns])
+                                recalculate = target_idx if overwrite_status else target_idx[latest['Status'].isna().to_numpy()]
+                                if len(recalculate):
+                                    set_meeting_rows(current_df, recalculate, compute_statuses(current_df.loc[recalculate]).to_frame('Status'))
                                 updated_count = len(to_update)
                             
                             # Add new
                             if not to_add.empty:
-                                to_add['Status'] = to_add.apply(calculate_status, axis=1)
+                                to_add = to_add.assign(Status=compute_statuses(to_add))
                                 current_df = pd.concat([current_df, to_add], ignore_index=True)
                                 added_count = len(to_add)
                             
-                            st.session_state.meetings_df = current_df
+                            st.session_state.meetings_df = coerce_meeting_ids(current_df)
                         
                         # Save to database and Excel
                         if save_meetings(st.session_state.meetings_df):
@@ -2747,15 +2506,13 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                                 success_msg += f" Added {added_count} new meeting(s)."
                             if updated_count > 0:
                                 success_msg += f" Updated {updated_count} existing meeting(s)."
-                            st.success(success_msg)
-                            time.sleep(1)
+                            st.session_state.save_message = success_msg
                             st.rerun()
                         else:
                             st.error("Failed to save imported data.")
                     
                     except Exception as e:
                         st.error(f"Error during import: {str(e)}")
-                        import traceback
                         st.code(traceback.format_exc())
         
         except Exception as e:
@@ -2779,10 +2536,12 @@ elif st.session_state.current_page == "Meetings Summary & Export":
     if not filtered_meetings.empty:
         total_count = len(filtered_meetings)
         if 'Status' in filtered_meetings.columns:
-            upcoming_count = len(filtered_meetings[filtered_meetings['Status'] == 'Upcoming'])
-            ongoing_count = len(filtered_meetings[filtered_meetings['Status'] == 'Ongoing'])
-            ended_count = len(filtered_meetings[filtered_meetings['Status'] == 'Ended'])
-            completed_count = len(filtered_meetings[filtered_meetings['Status'] == 'Completed'])
+            # One counting pass instead of a boolean scan per status
+            status_counts = filtered_meetings['Status'].value_counts()
+            upcoming_count = int(status_counts.get('Upcoming', 0))
+            ongoing_count = int(status_counts.get('Ongoing', 0))
+            ended_count = int(status_counts.get('Ended', 0))
+            completed_count = int(status_counts.get('Completed', 0))
         else:
             upcoming_count = ongoing_count = ended_count = completed_count = 0
     else:
@@ -2811,14 +2570,22 @@ elif st.session_state.current_page == "Meetings Summary & Export":
     """, unsafe_allow_html=True)
     
     if not filtered_meetings.empty:
-        # Prepare display dataframe
-        display_df = filtered_meetings.copy()
-        
-        # Format date columns if they exist
-        if 'Meeting Date' in display_df.columns:
-            display_df['Meeting Date'] = pd.to_datetime(display_df['Meeting Date'], errors='coerce').dt.strftime('%Y-%m-%d')
-        if 'Follow up Date' in display_df.columns:
-            display_df['Follow up Date'] = pd.to_datetime(display_df['Follow up Date'], errors='coerce').dt.strftime('%Y-%m-%d')
+        # Each row is a set of widgets, so only one page of meetings is rendered per run
+        total_meetings = len(filtered_meetings)
+        page_count = math.ceil(total_meetings / MEETINGS_PAGE_SIZE)
+        if st.session_state.get('meetings_table_page', 1) > page_count:
+            st.session_state.meetings_table_page = page_count
+        page = 1
+        if page_count > 1:
+            page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1, key='meetings_table_page')
+        page_start = (page - 1) * MEETINGS_PAGE_SIZE
+        page_meetings = filtered_meetings.iloc[page_start:page_start + MEETINGS_PAGE_SIZE]
+        
+        # Prepare display dataframe with formatted date columns; assign leaves the cached filter result untouched
+        display_df = page_meetings.assign(**{
+            col: pd.to_datetime(page_meetings[col], errors='coerce').dt.strftime('%Y-%m-%d')
+            for col in ('Meeting Date', 'Follow up Date') if col in page_meetings.columns
+        })
         
         # Select columns to display (show most important ones; Meeting Title removed)
         display_columns = ['Organization', 'Meeting Date', 'Start Time', 'Status', 
@@ -2879,6 +2646,7 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                     deleted_count = 0
                     failed_count = 0
                     ids_to_delete = list(st.session_state.selected_meetings.copy())
+                    deleted_ids = []
                     
                     for meeting_id_int in ids_to_delete:
                         try:
@@ -2890,11 +2658,8 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                             
                             # Only delete from dataframe if database delete succeeded
                             if delete_success:
-                                # Delete from dataframe
-                                if 'Meeting ID' in st.session_state.meetings_df.columns:
-                                    st.session_state.meetings_df = st.session_state.meetings_df[
-                                        st.session_state.meetings_df['Meeting ID'] != meeting_id_int
-                                    ]
+                                # Dropped from the dataframe in one pass after the loop
+                                deleted_ids.append(meeting_id_int)
                                 # Remove from selected set
                                 st.session_state.selected_meetings.discard(meeting_id_int)
                                 deleted_count += 1
@@ -2904,8 +2669,11 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                             failed_count += 1
                             st.session_state.selected_meetings.discard(meeting_id_int)
                     
-                    # Save updated dataframe
+                    # Drop every deleted meeting in place, then save
                     if deleted_count > 0:
+                        if 'Meeting ID' in st.session_state.meetings_df.columns:
+                            df = st.session_state.meetings_df
+                            df.drop(index=df.index[df['Meeting ID'].isin(deleted_ids)], inplace=True)
                         save_meetings(st.session_state.meetings_df)
                         if failed_count == 0:
                             st.success(f"{deleted_count} Meeting(s) Deleted Successfully")
@@ -2915,21 +2683,8 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                     elif failed_count > 0:
                         st.error(f"Failed to delete {failed_count} meeting(s)")
         
-        # Scrollable table container: marker + CSS so the table body scrolls
+        # Scrollable table container: the marker is styled from .streamlit/style.css so the table body scrolls
         st.markdown("<div id='meetings-table-scroll-marker'></div>", unsafe_allow_html=True)
-        st.markdown("""
-        <style>
-        div[data-testid="stVerticalBlock"]:has(#meetings-table-scroll-marker) {
-            max-height: 65vh !important;
-            overflow-y: auto !important;
-            overflow-x: auto !important;
-            border: 1px solid #e2e8f0;
-            border-radius: 8px;
-            padding: 0.5rem;
-            margin-bottom: 0.5rem;
-        }
-        </style>
-        """, unsafe_allow_html=True)
         # Create a custom table with Edit and Delete buttons (optimized column widths)
         header_cols = st.columns(col_widths)
         
@@ -2950,10 +2705,10 @@ elif st.session_state.current_page == "Meetings Summary & Export":
         for pos, (idx, row) in enumerate(display_df.iterrows()):
             row_cols = st.columns(col_widths)
             
-            # Get meeting ID for this row (use position since display_df is a copy of filtered_meetings)
+            # Get meeting ID for this row (use position since display_df is a copy of page_meetings)
             meeting_id = None
-            if 'Meeting ID' in filtered_meetings.columns and pos < len(filtered_meetings):
-                meeting_id = filtered_meetings.iloc[pos].get('Meeting ID')
+            if 'Meeting ID' in page_meetings.columns and pos < len(page_meetings):
+                meeting_id = page_meetings.iloc[pos].get('Meeting ID')
             
             # Checkbox for selection
             if meeting_id is not None and pd.notna(meeting_id):
@@ -3005,11 +2760,10 @@ elif st.session_state.current_page == "Meetings Summary & Export":
                         
                         # Only delete from dataframe if database delete succeeded
                         if delete_success:
-                            # Delete from dataframe
+                            # Delete from dataframe in place rather than copying the survivors
                             if 'Meeting ID' in st.session_state.meetings_df.columns:
-                                st.session_state.meetings_df = st.session_state.meetings_df[
-                                    st.session_state.meetings_df['Meeting ID'] != meeting_id_int
-                                ]
+                                df = st.session_state.meetings_df
+                                df.drop(index=df.index[df['Meeting ID'].isin([meeting_id_int])], inplace=True)
                             
                             # Save updated dataframe
                             save_meetings(st.session_state.meetings_df)
@@ -3022,7 +2776,10 @@ elif st.session_state.current_page == "Meetings Summary & Export":
             
             st.markdown("<hr style='margin: 0.3rem 0;'>", unsafe_allow_html=True)
         
-        st.caption(f"Showing {len(display_df)} meeting(s)")
+        if page_count > 1:
+            st.caption(f"Showing {page_start + 1}-{page_start + len(display_df)} of {total_meetings} meeting(s)")
+        else:
+            st.caption(f"Showing {len(display_df)} meeting(s)")
     else:
         st.info("📭 No meetings found matching your filters.")
     
@@ -3043,18 +2800,19 @@ elif st.session_state.current_page == "Meetings Summary & Export":
         if st.button("📥 Export to Excel", type="primary", use_container_width=True):
                 export_filename = f"meeting_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
                 try:
-                    st.session_state.meetings_df.to_excel(export_filename, index=False)
-                    st.success(f"✅ Data exported to {export_filename}")
+                    # Build the workbook in memory and serve it directly, no file on disk
+                    export_buffer = io.BytesIO()
+                    write_excel(st.session_state.meetings_df, export_buffer)
+                    st.success(f"✅ Export ready: {export_filename}")
                     
                     # Provide download button
-                    with open(export_filename, "rb") as file:
-                        st.download_button(
-                            label="⬇️ Download Exported File",
-                            data=file,
-                            file_name=export_filename,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True
-                        )
+                    st.download_button(
+                        label="⬇️ Download Exported File",
+                        data=export_buffer.getvalue(),
+                        file_name=export_filename,
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True
+                    )
                 except Exception as e:
                     st.error(f"Error exporting data: {e}")
     else:
@@ -3078,7 +2836,7 @@ elif st.session_state.current_page == "Add New Podcast Meeting":
         
         with col2:
             host = st.text_input("Host", value="", placeholder="Enter podcast host name", help="Enter the name of the podcast host")
-            status = st.selectbox("Status", ["Upcoming", "Completed", "Cancelled"], index=0)
+            status = st.selectbox("Status", PODCAST_STATUS_OPTIONS, index=0)
             contacted_through = st.text_input("Contacted Through (Platform)", value="", placeholder="e.g., LinkedIn, Email, etc.", help="Enter the platform used to contact the guest")
         
         st.markdown("### 🕐 Date & Time")
@@ -3099,7 +2857,7 @@ elif st.session_state.current_page == "Add New Podcast Meeting":
             if not name.strip():
                 st.error("Name is required")
             else:
-                new_podcast_meeting = pd.DataFrame([{
+                new_podcast_row = {
                     'Podcast ID': get_next_podcast_id(st.session_state.podcast_meetings_df),
                     'Name': name.strip(),
                     'Designation': designation.strip() if designation else '',
@@ -3112,16 +2870,16 @@ elif st.session_state.current_page == "Add New Podcast Meeting":
                     'Status': status,
                     'Contacted Through': contacted_through.strip() if contacted_through else '',
                     'Comments': comments.strip() if comments else ''
-                }])
+                }
+                new_podcast_meeting = pd.DataFrame([new_podcast_row])
                 
                 if st.session_state.podcast_meetings_df.empty:
                     st.session_state.podcast_meetings_df = new_podcast_meeting
                 else:
                     st.session_state.podcast_meetings_df = pd.concat([st.session_state.podcast_meetings_df, new_podcast_meeting], ignore_index=True)
                 
-                if save_podcast_meetings(st.session_state.podcast_meetings_df):
-                    st.success("✅ Podcast Meeting Saved Successfully!")
-                    time.sleep(1)
+                if append_podcast_meeting(st.session_state.podcast_meetings_df, new_podcast_row):
+                    st.session_state.save_message = "✅ Podcast Meeting Saved Successfully!"
                     st.rerun()
                 else:
                     st.error("❌ Failed to save podcast meeting. Please try again.")
@@ -3131,32 +2889,23 @@ elif st.session_state.current_page == "Edit/Update Podcast Meeting":
     if st.session_state.podcast_meetings_df.empty:
         st.info("📭 No podcast meetings found. Please add a podcast meeting first.")
     else:
-        podcast_meetings_list = []
-        meeting_index_map = {}
-        
-        for idx, row in st.session_state.podcast_meetings_df.iterrows():
-            podcast_id = row.get('Podcast ID', 'N/A')
-            name = row.get('Name', 'N/A')
-            date = row.get('Date', '')
-            if pd.notna(date):
-                try:
-                    date_str = pd.to_datetime(date).strftime('%Y-%m-%d')
-                except:
-                    date_str = str(date)
-            else:
-                date_str = 'N/A'
-            label = f"ID: {podcast_id} - {name} ({date_str})"
-            podcast_meetings_list.append(label)
-            meeting_index_map[label] = idx
+        # Build all labels column-wise: "ID: id - name (date)"
+        label_columns = st.session_state.podcast_meetings_df.reindex(columns=['Podcast ID', 'Name', 'Date'], fill_value='N/A')
+        date_strs = to_naive_dates(label_columns['Date']).dt.strftime('%Y-%m-%d').fillna('N/A')
+        podcast_meetings_list = (
+            'ID: ' + label_columns['Podcast ID'].astype(str).fillna('nan') + ' - '
+            + label_columns['Name'].astype(str).fillna('nan') + ' (' + date_strs + ')'
+        ).tolist()
+        meeting_index_map = dict(zip(podcast_meetings_list, label_columns.index))
+        # Podcast ID -> position in podcast_meetings_list, for preselecting without rescanning the frame
+        positions = pd.Series(np.arange(len(label_columns)), index=label_columns['Podcast ID'].to_numpy())
+        positions = positions[positions.index.notna() & ~positions.index.duplicated()]
+        position_by_podcast_id = positions.to_dict()
         
         if 'edit_podcast_meeting_id' in st.session_state:
             selected_meeting_id = st.session_state.edit_podcast_meeting_id
-            mask = st.session_state.podcast_meetings_df['Podcast ID'] == selected_meeting_id
-            if mask.any():
-                selected_idx = st.session_state.podcast_meetings_df[mask].index[0]
-                selected_meeting = st.session_state.podcast_meetings_df.iloc[selected_idx]
-                selected_meeting_label = f"ID: {selected_meeting_id} - {selected_meeting.get('Name', 'N/A')} ({pd.to_datetime(selected_meeting.get('Date', '')).strftime('%Y-%m-%d') if pd.notna(selected_meeting.get('Date', '')) else 'N/A'})"
-                default_index = podcast_meetings_list.index(selected_meeting_label) if selected_meeting_label in podcast_meetings_list else 0
+            if selected_meeting_id in position_by_podcast_id:
+                default_index = position_by_podcast_id[selected_meeting_id]
                 del st.session_state.edit_podcast_meeting_id
             else:
                 default_index = 0
@@ -3167,7 +2916,7 @@ elif st.session_state.current_page == "Edit/Update Podcast Meeting":
         
         if selected_meeting_label in meeting_index_map:
             selected_idx = meeting_index_map[selected_meeting_label]
-            selected_meeting = st.session_state.podcast_meetings_df.iloc[selected_idx]
+            selected_meeting = st.session_state.podcast_meetings_df.iloc[selected_idx].to_dict()
             selected_podcast_id = selected_meeting.get('Podcast ID')
             st.session_state.selected_podcast_meeting_index = selected_idx
             
@@ -3207,7 +2956,7 @@ elif st.session_state.current_page == "Edit/Update Podcast Meeting":
                 with col2:
                     edit_host = st.text_input("Host", value=str(selected_meeting.get('Host', '')), placeholder="Enter podcast host name")
                     current_status = str(selected_meeting.get('Status', 'Upcoming'))
-                    edit_status = st.selectbox("Status", ["Upcoming", "Completed", "Cancelled"], index=["Upcoming", "Completed", "Cancelled"].index(current_status) if current_status in ["Upcoming", "Completed", "Cancelled"] else 0)
+                    edit_status = st.selectbox("Status", PODCAST_STATUS_OPTIONS, index=PODCAST_STATUS_OPTIONS.index(current_status) if current_status in PODCAST_STATUS_OPTIONS else 0)
                     edit_contacted_through = st.text_input("Contacted Through (Platform)", value=str(selected_meeting.get('Contacted Through', '')), placeholder="e.g., LinkedIn, Email, etc.")
                 
                 st.markdown("### 🕐 Date & Time")
@@ -3227,15 +2976,7 @@ elif st.session_state.current_page == "Edit/Update Podcast Meeting":
                     edit_day = st.text_input("Day", value=str(selected_meeting.get('Day', '')), placeholder="e.g., Monday, Tuesday")
                 
                 with col_date3:
-                    time_str = str(selected_meeting.get('Time', ''))
-                    try:
-                        if ':' in time_str and time_str.strip():
-                            time_parts = time_str.split(':')
-                            edit_time = st.time_input("Time", value=datetime.strptime(time_str[:5], '%H:%M').time() if len(time_parts) >= 2 else None)
-                        else:
-                            edit_time = st.time_input("Time", value=None)
-                    except:
-                        edit_time = st.time_input("Time", value=None)
+                    edit_time = st.time_input("Time", value=_parse_time(selected_meeting.get('Time', '')))
                 
                 st.markdown("### 💬 Comments")
                 edit_comments = st.text_area("Comments", value=str(selected_meeting.get('Comments', '')), height=100)
@@ -3247,21 +2988,25 @@ elif st.session_state.current_page == "Edit/Update Podcast Meeting":
                         st.error("Name is required")
                     else:
                         idx = st.session_state.selected_podcast_meeting_index
-                        st.session_state.podcast_meetings_df.at[idx, 'Name'] = edit_name.strip()
-                        st.session_state.podcast_meetings_df.at[idx, 'Designation'] = edit_designation.strip() if edit_designation else ''
-                        st.session_state.podcast_meetings_df.at[idx, 'Organization'] = edit_organization.strip() if edit_organization else ''
-                        st.session_state.podcast_meetings_df.at[idx, 'LinkedIn URL'] = edit_linkedin_url.strip() if edit_linkedin_url else ''
-                        st.session_state.podcast_meetings_df.at[idx, 'Host'] = edit_host.strip() if edit_host else ''
-                        st.session_state.podcast_meetings_df.at[idx, 'Date'] = edit_date if edit_date else pd.NaT
-                        st.session_state.podcast_meetings_df.at[idx, 'Day'] = edit_day.strip() if edit_day else ''
-                        st.session_state.podcast_meetings_df.at[idx, 'Time'] = edit_time.strftime('%H:%M:%S') if edit_time else ''
-                        st.session_state.podcast_meetings_df.at[idx, 'Status'] = edit_status
-                        st.session_state.podcast_meetings_df.at[idx, 'Contacted Through'] = edit_contacted_through.strip() if edit_contacted_through else ''
-                        st.session_state.podcast_meetings_df.at[idx, 'Comments'] = edit_comments.strip() if edit_comments else ''
+                        updates = {
+                            'Name': edit_name,
+                            'Designation': edit_designation,
+                            'Organization': edit_organization,
+                            'LinkedIn URL': edit_linkedin_url,
+                            'Host': edit_host,
+                            'Date': pd.Timestamp(edit_date) if edit_date else pd.NaT,
+                            'Day': edit_day,
+                            'Time': edit_time.strftime('%H:%M:%S') if edit_time else '',
+                            'Status': edit_status,
+                            'Contacted Through': edit_contacted_through,
+                            'Comments': edit_comments,
+                        }
+                        # Strip each text value once and write the row in a single .loc assignment
+                        updates = {col: value.strip() if isinstance(value, str) else value for col, value in updates.items()}
+                        set_meeting_values(st.session_state.podcast_meetings_df, idx, updates)
                         
                         if save_podcast_meetings(st.session_state.podcast_meetings_df):
-                            st.success("✅ Podcast Meeting Updated Successfully!")
-                            time.sleep(1)
+                            st.session_state.save_message = "✅ Podcast Meeting Updated Successfully!"
                             st.rerun()
                         else:
                             st.error("❌ Failed to update podcast meeting. Please try again.")
@@ -3275,20 +3020,20 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
         col_filter1, col_filter2, col_filter3 = st.columns(3)
         
         with col_filter1:
-            status_filter = st.multiselect("Filter by Status", options=["Upcoming", "Completed", "Cancelled"], default=[])
+            status_filter = st.multiselect("Filter by Status", options=PODCAST_STATUS_OPTIONS, default=[])
         with col_filter2:
             organization_filter = st.text_input("Filter by Organization", placeholder="Enter organization name")
         with col_filter3:
             host_filter = st.text_input("Filter by Host", placeholder="Enter host name")
         
-        filtered_meetings = st.session_state.podcast_meetings_df.copy()
+        filtered_meetings = st.session_state.podcast_meetings_df
         
         if status_filter:
             filtered_meetings = filtered_meetings[filtered_meetings['Status'].isin(status_filter)]
         if organization_filter:
-            filtered_meetings = filtered_meetings[filtered_meetings['Organization'].astype(str).str.contains(organization_filter, case=False, na=False)]
+            filtered_meetings = filtered_meetings[filtered_meetings['Organization'].astype(str).str.contains(organization_filter, case=False, regex=False, na=False)]
         if host_filter:
-            filtered_meetings = filtered_meetings[filtered_meetings['Host'].astype(str).str.contains(host_filter, case=False, na=False)]
+            filtered_meetings = filtered_meetings[filtered_meetings['Host'].astype(str).str.contains(host_filter, case=False, regex=False, na=False)]
         
         # Import/Upload section - moved to top for better visibility
         st.markdown("---")
@@ -3309,11 +3054,7 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
             st.write("Upload an Excel file to import or update podcast meeting records. Download the template below to ensure correct format.")
         with col_template2:
             # Create template dataframe with all template columns
-            template_columns = [
-                'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-            ]
-            template_df = pd.DataFrame(columns=template_columns)
+            template_df = pd.DataFrame(columns=list(PODCAST_TEMPLATE_COLUMNS))
             # Add sample row
             template_df = pd.concat([template_df, pd.DataFrame([{
                 'Podcast ID': 1,
@@ -3331,9 +3072,8 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
             }])], ignore_index=True)
             
             # Save template to bytes
-            import io
             template_buffer = io.BytesIO()
-            template_df.to_excel(template_buffer, index=False)
+            write_excel(template_df, template_buffer)
             template_buffer.seek(0)
             
             st.download_button(
@@ -3354,8 +3094,9 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
         
         if uploaded_file is not None:
             try:
+                uploaded_bytes = uploaded_file.getvalue()
                 # Read the uploaded file without header first to inspect
-                temp_df = pd.read_excel(uploaded_file, header=None)
+                temp_df = read_uploaded_excel(uploaded_bytes, None)
                 
                 # Look for a row that contains "Name" (case-insensitive) - check first 10 rows
                 header_row = None
@@ -3369,17 +3110,17 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
                 
                 if header_row is not None:
                     # Re-read with the correct header row
-                    import_df = pd.read_excel(uploaded_file, header=header_row)
+                    import_df = read_uploaded_excel(uploaded_bytes, header_row)
                 else:
                     # Try with header=0 first
-                    import_df = pd.read_excel(uploaded_file, header=0)
+                    import_df = read_uploaded_excel(uploaded_bytes, 0)
                     # If we got "Unnamed" columns, use first non-empty row as header
                     if any('Unnamed' in str(col) for col in import_df.columns) or len([c for c in import_df.columns if str(c).strip()]) == 0:
                         # Find first row with actual data/headers
                         for idx in range(min(5, len(temp_df))):
                             row_values = [str(val).strip() if pd.notna(val) else '' for val in temp_df.iloc[idx].values]
                             if any(val for val in row_values):  # If row has any non-empty values
-                                import_df = pd.read_excel(uploaded_file, header=idx)
+                                import_df = read_uploaded_excel(uploaded_bytes, idx)
                                 break
                 
                 # Normalize column names (strip whitespace and make case-insensitive mapping)
@@ -3408,8 +3149,7 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
                 else:
                     # Rename columns to standard format (case-insensitive)
                     rename_dict = {}
-                    for std_col in ['Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                                   'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments']:
+                    for std_col in PODCAST_TEMPLATE_COLUMNS:
                         std_col_lower = std_col.lower()
                         if std_col_lower in column_mapping:
                             original_col = column_mapping[std_col_lower]
@@ -3418,16 +3158,10 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
                     
                     if rename_dict:
                         import_df = import_df.rename(columns=rename_dict)
-                    # Add missing columns with empty values
-                    template_columns = [
-                        'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                        'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-                    ]
-                    
-                    missing_columns = [col for col in template_columns if col not in import_df.columns]
+                    # Add missing columns with empty values, all in one assign
+                    missing_columns = [col for col in PODCAST_TEMPLATE_COLUMNS if col not in import_df.columns]
                     if missing_columns:
-                        for col in missing_columns:
-                            import_df[col] = ''
+                        import_df = import_df.assign(**dict.fromkeys(missing_columns, ''))
                     
                     # Ensure datetime columns are properly formatted
                     if 'Date' in import_df.columns:
@@ -3441,18 +3175,8 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
                     # Proceed with import
                     if st.button("✅ Import Data", type="primary", use_container_width=True, key="import_podcast_btn"):
                         try:
-                            # Ensure all template columns exist
-                            template_columns = [
-                                'Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                                'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments'
-                            ]
-                            for col in template_columns:
-                                if col not in import_df.columns:
-                                    import_df[col] = ''
-                            
                             # Fill NaN values with empty strings for text columns
-                            text_columns = ['Podcast ID', 'Name', 'Designation', 'Organization', 'LinkedIn URL',
-                                          'Host', 'Day', 'Time', 'Status', 'Contacted Through', 'Comments']
+                            text_columns = [col for col in PODCAST_TEMPLATE_COLUMNS if col != 'Date']
                             for col in text_columns:
                                 if col in import_df.columns:
                                     import_df[col] = import_df[col].fillna('').astype(str)
@@ -3483,7 +3207,7 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
                                             max_id = 0
                                         next_id = int(max_id) + 1
                                         import_df.loc[missing_mask, 'Podcast ID'] = range(next_id, next_id + missing_mask.sum())
-                                st.session_state.podcast_meetings_df = import_df.copy()
+                                st.session_state.podcast_meetings_df = import_df
                                 added_count = len(import_df)
                                 updated_count = 0
                             else:
@@ -3518,21 +3242,22 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
                                     import_df_ids = pd.to_numeric(import_df['Podcast ID'], errors='coerce')
                                     mask_update = import_df_ids.isin(existing_ids) & import_df_ids.notna()
                                     mask_add = ~mask_update
-                                    to_update = import_df[mask_update].copy()
-                                    to_add = import_df[mask_add].copy()
+                                    to_update = import_df[mask_update]
+                                    to_add = import_df[mask_add]
                                 else:
                                     to_update = pd.DataFrame()
-                                    to_add = import_df.copy()
+                                    to_add = import_df
                                 
-                                # Update existing
+                                # Update existing, aligned on Podcast ID like the meetings import
                                 if not to_update.empty:
-                                    for _, row in to_update.iterrows():
-                                        podcast_id = pd.to_numeric(row.get('Podcast ID'), errors='coerce')
-                                        if pd.notna(podcast_id) and 'Podcast ID' in current_df.columns:
-                                            idx = current_df[pd.to_numeric(current_df['Podcast ID'], errors='coerce') == podcast_id].index[0]
-                                            for col in current_df.columns:
-                                                if col in row:
-                                                    current_df.at[idx, col] = row[col]
+                                    # Later rows for the same ID win, as they did when applied one by one
+                                    latest = to_update.drop_duplicates(subset='Podcast ID', keep='last')
+                                    current_ids = current_df['Podcast ID']
+                                    first_rows = ~current_ids.duplicated()
+                                    index_by_id = pd.Series(current_df.index[first_rows], index=current_ids[first_rows].to_numpy())
+                                    target_idx = index_by_id.loc[latest['Podcast ID'].to_numpy()].to_numpy()
+                                    columns = [col for col in current_df.columns if col in latest.columns]
+                                    set_meeting_rows(current_df, target_idx, latest[columns])
                                     updated_count = len(to_update)
                                 
                                 # Add new
@@ -3549,15 +3274,13 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
                                     success_msg += f" Added {added_count} new podcast meeting(s)."
                                 if updated_count > 0:
                                     success_msg += f" Updated {updated_count} existing podcast meeting(s)."
-                                st.success(success_msg)
-                                time.sleep(1)
+                                st.session_state.save_message = success_msg
                                 st.rerun()
                             else:
                                 st.error("Failed to save imported data.")
                         
                         except Exception as e:
                             st.error(f"Error during import: {str(e)}")
-                            import traceback
                             st.code(traceback.format_exc())
             
             except Exception as e:
@@ -3566,27 +3289,25 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
         
         st.markdown("### 📊 Summary Statistics")
         col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+        status_counts = st.session_state.podcast_meetings_df['Status'].value_counts()
         with col_stat1:
             st.metric("Total Podcast Meetings", len(st.session_state.podcast_meetings_df))
         with col_stat2:
-            upcoming_count = len(st.session_state.podcast_meetings_df[st.session_state.podcast_meetings_df['Status'] == 'Upcoming'])
-            st.metric("Upcoming", upcoming_count)
+            st.metric("Upcoming", int(status_counts.get('Upcoming', 0)))
         with col_stat3:
-            completed_count = len(st.session_state.podcast_meetings_df[st.session_state.podcast_meetings_df['Status'] == 'Completed'])
-            st.metric("Completed", completed_count)
+            st.metric("Completed", int(status_counts.get('Completed', 0)))
         with col_stat4:
-            cancelled_count = len(st.session_state.podcast_meetings_df[st.session_state.podcast_meetings_df['Status'] == 'Cancelled'])
-            st.metric("Cancelled", cancelled_count)
+            st.metric("Cancelled", int(status_counts.get('Cancelled', 0)))
         
         st.markdown("### 📋 Podcast Meetings List")
         
         if not filtered_meetings.empty:
             available_columns = ['Podcast ID', 'Name', 'Designation', 'Organization', 'Host', 'Date', 'Day', 'Time', 'Status', 'Contacted Through']
             display_columns = [col for col in available_columns if col in filtered_meetings.columns]
-            display_df = filtered_meetings[display_columns].copy()
+            display_df = filtered_meetings[display_columns]
             
             if 'Date' in display_df.columns:
-                display_df['Date'] = display_df['Date'].apply(lambda x: pd.to_datetime(x).strftime('%Y-%m-%d') if pd.notna(x) else 'N/A')
+                display_df = display_df.assign(Date=display_df['Date'].apply(lambda x: pd.to_datetime(x).strftime('%Y-%m-%d') if pd.notna(x) else 'N/A'))
             
             # Multi-select and delete section
             col_select1, col_select2 = st.columns([3, 1])
@@ -3650,21 +3371,8 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
             num_data_cols = len(display_columns)
             col_widths = [1] + [3] * num_data_cols + [1, 1]
             
-            # Scrollable podcast table container
+            # Scrollable podcast table container (styled from .streamlit/style.css)
             st.markdown("<div id='podcast-table-scroll-marker'></div>", unsafe_allow_html=True)
-            st.markdown("""
-            <style>
-            div:has(> #podcast-table-scroll-marker) {
-                max-height: 65vh;
-                overflow-y: auto;
-                overflow-x: auto;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 0.5rem;
-                margin-bottom: 0.5rem;
-            }
-            </style>
-            """, unsafe_allow_html=True)
             
             header_cols = st.columns(col_widths)
             header_cols[0].markdown("<div style='line-height: 1.4; white-space: nowrap;'><small><strong>Select</strong></small></div>", unsafe_allow_html=True)
@@ -3748,16 +3456,16 @@ elif st.session_state.current_page == "Podcast Meetings Summary & Export":
             if st.button("📥 Export to Excel", type="primary", use_container_width=True, key="export_podcast"):
                 export_filename = f"podcast_meetings_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
                 try:
-                    st.session_state.podcast_meetings_df.to_excel(export_filename, index=False)
-                    st.success(f"✅ Data exported to {export_filename}")
-                    with open(export_filename, "rb") as file:
-                        st.download_button(
-                            label="⬇️ Download Exported File",
-                            data=file,
-                            file_name=export_filename,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True
-                        )
+                    export_buffer = io.BytesIO()
+                    write_excel(st.session_state.podcast_meetings_df, export_buffer)
+                    st.success(f"✅ Export ready: {export_filename}")
+                    st.download_button(
+                        label="⬇️ Download Exported File",
+                        data=export_buffer.getvalue(),
+                        file_name=export_filename,
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True
+                    )
                 except Exception as e:
                     st.error(f"Error exporting data: {e}")
         else: